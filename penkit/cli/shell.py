@@ -22,6 +22,28 @@ from penkit.core.exceptions import PenKitException, ToolExecutionError, OutputPa
 from penkit.core.plugin import PluginManager
 from penkit.core.session import Session
 
+# Characters that require full shell-style tokenization
+_SHLEX_SPECIAL_CHARS = frozenset("\"'\\")
+
+# Static panels are built once and reused for every shell start/exit
+_WELCOME_PANEL = Panel(
+    "[bold]Welcome to PenKit - Advanced Penetration Testing Toolkit[/bold]\n"
+    "Type 'help' for a list of commands",
+    title="PenKit",
+    border_style="blue",
+)
+_GOODBYE_PANEL = Panel(
+    "[bold]Thank you for using PenKit![/bold]", title="Goodbye", border_style="green"
+)
+_CONFIG_USAGE_PANEL = Panel(
+    "config - Show all configuration\n"
+    "config get <key> - Get configuration value\n"
+    "config set <key> <value> - Set configuration value\n"
+    "config save - Save configuration to file",
+    title="Config Command Usage",
+    border_style="blue",
+)
+
 
 class PenKitCompleter(Completer):
     """Completer for PenKit shell commands."""
@@ -146,8 +168,19 @@ class PenKitShell:
             style=Style.from_dict({"prompt": "ansigreen bold"}),
         )
 
-        # Create a session
-        self.penkit_session = Session(name="default", path=self.workdir)
+        # The session (and its database) is opened on first use
+        self._penkit_session: Optional[Session] = None
+
+    @property
+    def penkit_session(self) -> Session:
+        """Get the current PenKit session, opening it on first access.
+
+        Returns:
+            The current session
+        """
+        if self._penkit_session is None:
+            self._penkit_session = Session(name="default", path=self.workdir)
+        return self._penkit_session
 
     def _get_prompt(self) -> str:
         """Get the current prompt string.
@@ -511,14 +544,7 @@ class PenKitShell:
 
             else:
                 self.console.print("[bold red]Invalid config command[/bold red]")
-                self.console.print(Panel(
-                    "config - Show all configuration\n"
-                    "config get <key> - Get configuration value\n"
-                    "config set <key> <value> - Set configuration value\n"
-                    "config save - Save configuration to file",
-                    title="Config Command Usage",
-                    border_style="blue"
-                ))
+                self.console.print(_CONFIG_USAGE_PANEL)
         except Exception as e:
             self.console.print(f"[bold red]Error in config command: {str(e)}[/bold red]")
             if self.debug_mode:
@@ -662,7 +688,11 @@ class PenKitShell:
             return True
 
         try:
-            args = shlex.split(user_input)
+            if _SHLEX_SPECIAL_CHARS.isdisjoint(user_input):
+                # Plain input tokenizes the same way with a simple split
+                args = user_input.split()
+            else:
+                args = shlex.split(user_input)
             command = args[0].lower()
             return self._process_command(command, args[1:])
         except Exception as e:
@@ -680,14 +710,7 @@ class PenKitShell:
 
     def start(self) -> None:
         """Start the interactive shell."""
-        self.console.print(
-            Panel(
-                "[bold]Welcome to PenKit - Advanced Penetration Testing Toolkit[/bold]\n"
-                "Type 'help' for a list of commands",
-                title="PenKit",
-                border_style="blue"
-            )
-        )
+        self.console.print(_WELCOME_PANEL)
 
         while True:
             try:
@@ -711,4 +734,4 @@ class PenKitShell:
                         )
                     )
 
-        self.console.print(Panel("[bold]Thank you for using PenKit![/bold]", title="Goodbye", border_style="green"))
\ No newline at end of file
+        self.console.print(_GOODBYE_PANEL)
\ No newline at end of file
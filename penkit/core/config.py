@@ -7,6 +7,9 @@ from typing import Any, Dict, Optional
 
 from penkit.core.exceptions import ConfigError
 
+_TRUE_VALUES = frozenset(("true", "yes", "1"))
+_FALSE_VALUES = frozenset(("false", "no", "0"))
+
 
 class Config:
     """Configuration manager for PenKit."""
@@ -104,19 +107,26 @@ class Config:
             Parsed value (bool, int, float, or string)
         """
         # Check for boolean values
-        if value.lower() in ("true", "yes", "1"):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             return True
-        if value.lower() in ("false", "no", "0"):
+        if lowered in _FALSE_VALUES:
             return False
 
-        # Check for numeric values
-        try:
-            if "." in value:
-                return float(value)
+        # Check for integer values without going through the exception path
+        digits = value[1:] if value[:1] in ("-", "+") else value
+        if digits.isdecimal():
             return int(value)
-        except ValueError:
-            # Return as string if not a number
-            return value
+
+        # Check for float values
+        if "." in value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+
+        # Return as string if not a number
+        return value
 
     def update(self, config_dict: Dict[str, Any]) -> None:
         """Update configuration with values from a dictionary.
@@ -0,0 +1,43 @@
+"""Database models for PenKit sessions."""
+
+import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+
+class Target(Base):
+    """Database model for a target."""
+
+    __tablename__ = "targets"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    description = sa.Column(sa.String, nullable=True)
+    ip_address = sa.Column(sa.String, nullable=True)
+    hostname = sa.Column(sa.String, nullable=True)
+    os = sa.Column(sa.String, nullable=True)
+    status = sa.Column(sa.String, nullable=True)
+    created_at = sa.Column(sa.DateTime, default=datetime.datetime.utcnow)
+    updated_at = sa.Column(
+        sa.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
+    )
+
+
+class Finding(Base):
+    """Database model for a finding."""
+
+    __tablename__ = "findings"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    target_id = sa.Column(sa.Integer, sa.ForeignKey("targets.id"), nullable=False)
+    name = sa.Column(sa.String, nullable=False)
+    description = sa.Column(sa.String, nullable=True)
+    severity = sa.Column(sa.String, nullable=True)
+    status = sa.Column(sa.String, nullable=True)
+    created_at = sa.Column(sa.DateTime, default=datetime.datetime.utcnow)
+    updated_at = sa.Column(
+        sa.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
+    )
@@ -1,5 +1,7 @@
 """Data models for PenKit."""
 
+import shlex
+from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone
 from enum import Enum
@@ -228,18 +230,33 @@ class Credential(BaseModel):
         return data
 
 
-class ToolResult(BaseModel):
-    """Model for storing the result of a tool execution."""
+@dataclass(frozen=True, slots=True)
+class ToolResult:
+    """Model for storing the result of a tool execution.
+
+    One is built for every tool run, so this is a slotted dataclass rather
+    than a validated pydantic model.
+    """
 
     tool_name: str
-    command: str
+    command: List[str]
     status: str
     start_time: datetime
     end_time: Optional[datetime] = None
     exit_code: Optional[int] = None
-    stdout: Optional[str] = None
+    stdout: Optional[Union[str, bytes]] = None
     stderr: Optional[str] = None
     parsed_result: Optional[Dict[str, Any]] = None
+    stdout_path: Optional[str] = None
+
+    @property
+    def command_line(self) -> str:
+        """Get the command as a shell-quoted string.
+
+        Returns:
+            Command line string
+        """
+        return shlex.join(self.command)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with serializable values.
@@ -247,18 +264,23 @@ class ToolResult(BaseModel):
         Returns:
             Dictionary representation
         """
+        stdout = self.stdout
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", errors="replace")
+
         result = {
             "tool_name": self.tool_name,
-            "command": self.command,
+            "command": self.command_line,
             "status": self.status,
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "exit_code": self.exit_code,
-            "stdout": self.stdout[:200] + "..."
-            if self.stdout and len(self.stdout) > 200
-            else self.stdout,
+            "stdout": stdout[:200] + "..."
+            if stdout and len(stdout) > 200
+            else stdout,
             "stderr": self.stderr,
             "parsed_result": self.parsed_result,
+            "stdout_path": self.stdout_path,
         }
         return result
 
@@ -20,6 +20,9 @@ hookimpl = pluggy.HookimplMarker("penkit")
 class PenKitPlugin:
     """Base class for all PenKit plugins."""
 
+    # Subclasses that declare their own __slots__ carry no instance __dict__
+    __slots__ = ("options",)
+
     name: str = "base_plugin"
     description: str = "Base plugin class"
     version: str = "0.1.0"
@@ -160,14 +163,23 @@ class PluginManager:
         sys.path.insert(0, str(modules_dir.parent.parent))
 
         try:
-            for item in modules_dir.iterdir():
-                if item.is_dir() and (item / "__init__.py").exists():
-                    module_name = f"penkit.modules.{item.name}"
-                    try:
-                        module = importlib.import_module(module_name)
-                        self._register_plugins_from_module(module)
-                    except ImportError as e:
-                        print(f"Failed to import module {module_name}: {e}")
+            # DirEntry.is_dir() uses the file type from the directory listing,
+            # so only package markers and symlinked packages need a stat
+            with os.scandir(modules_dir) as entries:
+                packages = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir()
+                    and os.path.exists(os.path.join(entry.path, "__init__.py"))
+                ]
+
+            for package in packages:
+                module_name = f"penkit.modules.{package}"
+                try:
+                    module = importlib.import_module(module_name)
+                    self._register_plugins_from_module(module)
+                except ImportError as e:
+                    print(f"Failed to import module {module_name}: {e}")
         finally:
             # Remove the added path
             if sys.path[0] == str(modules_dir.parent.parent):
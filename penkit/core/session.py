@@ -4,50 +4,63 @@ import datetime
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import sqlalchemy as sa
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
+from penkit.utils import json_utils
 from penkit.utils.json_utils import PenKitJSONEncoder
 
-Base = declarative_base()
+if TYPE_CHECKING:
+    from penkit.core.db import Finding, Target
+
+# Database models are imported lazily so that SQLAlchemy is only loaded once a
+# session is actually opened
+_DB_EXPORTS = ("Base", "Target", "Finding")
+
+# Buffer size used when streaming scan results to disk
+RESULT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories already created by this process
+_created_dirs: Set[Path] = set()
+
 
+def _ensure_dir(path: Path) -> None:
+    """Create a directory unless it is already known to exist.
 
-class Target(Base):
-    """Database model for a target."""
+    Args:
+        path: Directory to create
+    """
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
 
-    __tablename__ = "targets"
 
-    id = sa.Column(sa.Integer, primary_key=True)
-    name = sa.Column(sa.String, nullable=False)
-    description = sa.Column(sa.String, nullable=True)
-    ip_address = sa.Column(sa.String, nullable=True)
-    hostname = sa.Column(sa.String, nullable=True)
-    os = sa.Column(sa.String, nullable=True)
-    status = sa.Column(sa.String, nullable=True)
-    created_at = sa.Column(sa.DateTime, default=datetime.datetime.utcnow)
-    updated_at = sa.Column(
-        sa.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
-    )
+def _forget_dirs(root: Path) -> None:
+    """Forget created directories at or below a removed root.
 
+    Args:
+        root: Directory that was removed
+    """
+    for path in [p for p in _created_dirs if p == root or root in p.parents]:
+        _created_dirs.discard(path)
 
-class Finding(Base):
-    """Database model for a finding."""
 
-    __tablename__ = "findings"
+def __getattr__(name: str) -> Any:
+    """Resolve database models lazily for backwards compatibility.
 
-    id = sa.Column(sa.Integer, primary_key=True)
-    target_id = sa.Column(sa.Integer, sa.ForeignKey("targets.id"), nullable=False)
-    name = sa.Column(sa.String, nullable=False)
-    description = sa.Column(sa.String, nullable=True)
-    severity = sa.Column(sa.String, nullable=True)
-    status = sa.Column(sa.String, nullable=True)
-    created_at = sa.Column(sa.DateTime, default=datetime.datetime.utcnow)
-    updated_at = sa.Column(
-        sa.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
-    )
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested database model
+
+    Raises:
+        AttributeError: If the attribute does not exist
+    """
+    if name in _DB_EXPORTS:
+        from penkit.core import db
+
+        return getattr(db, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Session:
@@ -67,9 +80,14 @@ class Session:
         else:
             self.path = path / "sessions" / name
 
-        self.path.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.path)
 
         # Initialize database
+        import sqlalchemy as sa
+        from sqlalchemy.orm import sessionmaker
+
+        from penkit.core.db import Base
+
         self.db_path = self.path / "session.db"
         self.engine = sa.create_engine(f"sqlite:///{self.db_path}")
         Base.metadata.create_all(self.engine)
@@ -102,7 +120,7 @@ class Session:
         self.metadata["updated_at"] = datetime.datetime.utcnow().isoformat()
         self._save_metadata()
 
-    def add_target(self, name: str, **kwargs: Any) -> Target:
+    def add_target(self, name: str, **kwargs: Any) -> "Target":
         """Add a target to the session.
 
         Args:
@@ -112,6 +130,8 @@ class Session:
         Returns:
             The created target
         """
+        from penkit.core.db import Target
+
         with self.Session() as db_session:
             target = Target(name=name, **kwargs)
             db_session.add(target)
@@ -119,16 +139,18 @@ class Session:
             db_session.refresh(target)
             return target
 
-    def get_targets(self) -> List[Target]:
+    def get_targets(self) -> List["Target"]:
         """Get all targets in the session.
 
         Returns:
             List of targets
         """
+        from penkit.core.db import Target
+
         with self.Session() as db_session:
             return db_session.query(Target).all()
 
-    def get_target(self, target_id: int) -> Optional[Target]:
+    def get_target(self, target_id: int) -> Optional["Target"]:
         """Get a target by ID.
 
         Args:
@@ -137,10 +159,12 @@ class Session:
         Returns:
             The target if found, None otherwise
         """
+        from penkit.core.db import Target
+
         with self.Session() as db_session:
             return db_session.query(Target).filter(Target.id == target_id).first()
 
-    def add_finding(self, target_id: int, name: str, **kwargs: Any) -> Finding:
+    def add_finding(self, target_id: int, name: str, **kwargs: Any) -> "Finding":
         """Add a finding to a target.
 
         Args:
@@ -151,6 +175,8 @@ class Session:
         Returns:
             The created finding
         """
+        from penkit.core.db import Finding
+
         with self.Session() as db_session:
             finding = Finding(target_id=target_id, name=name, **kwargs)
             db_session.add(finding)
@@ -158,7 +184,7 @@ class Session:
             db_session.refresh(finding)
             return finding
 
-    def get_findings(self, target_id: Optional[int] = None) -> List[Finding]:
+    def get_findings(self, target_id: Optional[int] = None) -> List["Finding"]:
         """Get all findings in the session.
 
         Args:
@@ -167,6 +193,8 @@ class Session:
         Returns:
             List of findings
         """
+        from penkit.core.db import Finding
+
         with self.Session() as db_session:
             query = db_session.query(Finding)
             if target_id is not None:
@@ -176,26 +204,30 @@ class Session:
     def save_scan_result(self, tool_name: str, result: Any) -> None:
         """Save a scan result to disk.
 
+        The result is written through ``json_utils.dump`` to a binary file
+        with a large write buffer. orjson's encoded bytes go straight to the
+        file; without orjson the stdlib encoder streams the result in chunks.
+
         Args:
             tool_name: The tool that generated the result
             result: The scan result (will be serialized to JSON)
         """
         results_dir = self.path / "results"
-        results_dir.mkdir(exist_ok=True)
+        _ensure_dir(results_dir)
 
         timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         result_path = results_dir / f"{tool_name}_{timestamp}.json"
 
         try:
-            with open(result_path, "w") as f:
-                json.dump(result, f, indent=2, cls=PenKitJSONEncoder)
+            with open(result_path, "wb", buffering=RESULT_WRITE_BUFFER_SIZE) as f:
+                json_utils.dump(result, f, indent=True)
         except Exception as e:
             import logging
             logging.getLogger("penkit").error(f"Error saving scan result: {str(e)}")
             # Create a simplified version of the result
             simplified_result = self._simplify_result(result)
-            with open(result_path, "w") as f:
-                json.dump(simplified_result, f, indent=2, cls=PenKitJSONEncoder)
+            with open(result_path, "wb", buffering=RESULT_WRITE_BUFFER_SIZE) as f:
+                json_utils.dump(simplified_result, f, indent=True)
 
     def _simplify_result(self, result: Any) -> Any:
         """Create a simplified version of a result for saving.
@@ -238,7 +270,7 @@ class Session:
             extension: File extension (default: txt)
         """
         artifacts_dir = self.path / "artifacts"
-        artifacts_dir.mkdir(exist_ok=True)
+        _ensure_dir(artifacts_dir)
 
         artifact_path = artifacts_dir / f"{name}.{extension}"
 
@@ -279,7 +311,10 @@ class SessionManager:
             self.base_path = base_path
 
         self.sessions_dir = self.base_path / "sessions"
-        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.sessions_dir)
+
+        # Cache of opened sessions by name to avoid rebuilding database engines
+        self._sessions: Dict[str, Session] = {}
 
     def create_session(self, name: str) -> Session:
         """Create a new session.
@@ -297,7 +332,9 @@ class SessionManager:
         if session_dir.exists():
             raise ValueError(f"Session '{name}' already exists")
 
-        return Session(name, self.base_path)
+        session = Session(name, self.base_path)
+        self._sessions[name] = session
+        return session
 
     def get_session(self, name: str) -> Optional[Session]:
         """Get a session by name.
@@ -310,9 +347,15 @@ class SessionManager:
         """
         session_dir = self.sessions_dir / name
         if not session_dir.exists():
+            self._sessions.pop(name, None)
             return None
 
-        return Session(name, self.base_path)
+        session = self._sessions.get(name)
+        if session is None:
+            session = Session(name, self.base_path)
+            self._sessions[name] = session
+
+        return session
 
     def list_sessions(self) -> List[Dict[str, Any]]:
         """List all sessions.
@@ -349,6 +392,10 @@ class SessionManager:
         if not session_dir.exists():
             return False
 
+        session = self._sessions.pop(name, None)
+        if session is not None:
+            session.engine.dispose()
+
         # Recursive delete
         for item in session_dir.glob("**/*"):
             if item.is_file():
@@ -361,4 +408,5 @@ class SessionManager:
                 item.rmdir()
 
         session_dir.rmdir()
+        _forget_dirs(session_dir)
         return True
\ No newline at end of file
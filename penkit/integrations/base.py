@@ -1,15 +1,36 @@
 """Base classes for tool integrations."""
 
 import asyncio
+import atexit
+import codecs
+import io
 import logging
+import mmap
 import os
 import shlex
+import shutil
+import stat
 import subprocess
 import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from penkit.core.config import config
 from penkit.core.exceptions import (
@@ -21,6 +42,197 @@ from penkit.core.models import ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Binary name -> binary path, or None for binaries missing from PATH
+_BINARY_CACHE: Dict[str, Optional[str]] = {}
+_BINARY_CACHE_LOCK = threading.Lock()
+
+# (binary path, version args) -> raw version output shared by all instances
+_VERSION_CACHE: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+_VERSION_CACHE_LOCK = threading.Lock()
+
+# (container image, container options) -> id of a long-lived container, or
+# None for images that cannot be kept running and use one container per command
+_CONTAINERS: Dict[Tuple[str, Tuple[str, ...]], Optional[str]] = {}
+_CONTAINERS_LOCK = threading.Lock()
+# Per-image locks held while a container starts, so a slow ``docker run``
+# (which may pull the image) only blocks callers waiting on the same image
+_CONTAINER_START_LOCKS: Dict[Tuple[str, Tuple[str, ...]], threading.Lock] = {}
+
+# Long-lived event loop that runs submitted tool coroutines in a helper thread
+_BACKGROUND_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+# Chunk size used when reading subprocess pipes
+READ_CHUNK_SIZE = 1 << 16
+
+# Subprocesses are started with close_fds=False and without preexec_fn, cwd or
+# session changes so that CPython can use posix_spawn() rather than fork+exec
+# for absolute executable paths. File descriptors opened by Python are
+# non-inheritable by default (PEP 446), so nothing leaks into the child.
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting it on first use.
+
+    Returns:
+        Running event loop owned by a daemon thread
+    """
+    global _BACKGROUND_LOOP
+
+    with _BACKGROUND_LOOP_LOCK:
+        if _BACKGROUND_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="penkit-tool-loop", daemon=True
+            ).start()
+            _BACKGROUND_LOOP = loop
+
+    return _BACKGROUND_LOOP
+
+
+async def _read_text(stream: Optional[asyncio.StreamReader]) -> Optional[str]:
+    """Read and decode a subprocess pipe as data arrives.
+
+    Args:
+        stream: Pipe to read, or None if the stream was not captured
+
+    Returns:
+        Decoded text, or None if the stream was not captured
+    """
+    if stream is None:
+        return None
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = io.StringIO()
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        buffer.write(decoder.decode(chunk))
+    buffer.write(decoder.decode(b"", final=True))
+    return buffer.getvalue()
+
+
+async def _read_bytes(stream: Optional[asyncio.StreamReader]) -> Optional[bytes]:
+    """Read a subprocess pipe without decoding it.
+
+    Args:
+        stream: Pipe to read, or None if the stream was not captured
+
+    Returns:
+        Raw output, or None if the stream was not captured
+    """
+    if stream is None:
+        return None
+
+    return await stream.read()
+
+
+def _is_executable_file(path: str) -> bool:
+    """Check that a path is an executable regular file with a single stat.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the path is a regular file with an execute bit set
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+def _end_time(start_time: datetime, start_ns: int) -> datetime:
+    """Get the wall-clock end time of a run from the monotonic clock.
+
+    Args:
+        start_time: Wall-clock time the run started
+        start_ns: Monotonic clock reading when the run started
+
+    Returns:
+        Wall-clock end time
+    """
+    elapsed_us = (time.monotonic_ns() - start_ns) // 1000
+    return start_time + timedelta(microseconds=elapsed_us)
+
+
+@lru_cache(maxsize=1)
+def _docker_version() -> Optional[str]:
+    """Get the installed Docker version, checking only once per process.
+
+    Returns:
+        Docker version string, or None if Docker is not available
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+            close_fds=False,
+        )
+        return result.stdout.strip()
+    except (subprocess.SubprocessError, FileNotFoundError) as e:
+        logger.error(f"Docker not found or not available: {e}")
+        return None
+
+
+def _remove_container(container_id: str) -> None:
+    """Force-remove a container started by PenKit.
+
+    Args:
+        container_id: Docker container ID
+    """
+    try:
+        subprocess.run(
+            ["docker", "rm", "-f", container_id],
+            capture_output=True,
+            timeout=30,
+            close_fds=False,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError) as e:
+        logger.warning(f"Failed to remove container {container_id}: {e}")
+
+
+def _container_running(container_id: str) -> bool:
+    """Check whether a container started by PenKit is still running.
+
+    Args:
+        container_id: Docker container ID
+
+    Returns:
+        True if the container exists and is running
+    """
+    try:
+        result = subprocess.run(
+            [
+                "docker",
+                "container",
+                "inspect",
+                "--format",
+                "{{.State.Running}}",
+                container_id,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            close_fds=False,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return False
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+@atexit.register
+def _remove_all_containers() -> None:
+    """Remove every long-lived container on interpreter exit."""
+    with _CONTAINERS_LOCK:
+        container_ids = [cid for cid in _CONTAINERS.values() if cid]
+        _CONTAINERS.clear()
+
+    for container_id in container_ids:
+        _remove_container(container_id)
+
 
 class ToolIntegration(ABC):
     """Base class for tool integrations."""
@@ -33,25 +245,36 @@ class ToolIntegration(ABC):
     container_image: Optional[str] = None
     container_options: List[str] = []
 
+    # Frozen copies of default_args/container_options, set per subclass
+    _default_args: Tuple[str, ...] = ()
+    _container_options: Tuple[str, ...] = ()
+
+    # Command prefix specialized for the state it was built from
+    _prefix_state: Optional[Tuple[Optional[str], bool, Optional[str]]] = None
+    _prefix: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Freeze the command-line class attributes of a subclass.
+
+        Args:
+            **kwargs: Keyword arguments for parent classes
+        """
+        super().__init_subclass__(**kwargs)
+        cls._default_args = tuple(cls.default_args)
+        cls._container_options = tuple(cls.container_options)
+
     def __init__(self) -> None:
         """Initialize the tool integration."""
         self.use_container = False
         self.binary_path: Optional[str] = None
-        self.version: Optional[str] = None
 
         # Check config for tool settings
         tool_config = config.get(f"tools.{self.name}", {})
 
         # Override with config if provided
         if "path" in tool_config and tool_config["path"]:
-            if os.path.isfile(tool_config["path"]) and os.access(
-                tool_config["path"], os.X_OK
-            ):
+            if _is_executable_file(tool_config["path"]):
                 self.binary_path = tool_config["path"]
-                try:
-                    self.version = self._get_version()
-                except Exception as e:
-                    logger.warning(f"Failed to get version for {self.name}: {e}")
         else:
             self._find_binary()
 
@@ -68,20 +291,46 @@ class ToolIntegration(ABC):
             logger.warning(f"No binary name defined for {self.name}")
             return
 
+        # Reuse the result of an earlier lookup for the same binary
+        with _BINARY_CACHE_LOCK:
+            known = self.binary_name in _BINARY_CACHE
+            cached = _BINARY_CACHE.get(self.binary_name)
+        if known:
+            if cached is None:
+                self.use_container = True
+            else:
+                self.binary_path = cached
+            return
+
         # Check if binary exists in path
-        for path in os.environ["PATH"].split(os.pathsep):
-            binary_path = os.path.join(path, self.binary_name)
-            if os.path.isfile(binary_path) and os.access(binary_path, os.X_OK):
-                self.binary_path = binary_path
-                try:
-                    self.version = self._get_version()
-                except Exception as e:
-                    logger.warning(f"Failed to get version for {self.name}: {e}")
-                return
+        binary_path = shutil.which(self.binary_name)
+        if binary_path:
+            self.binary_path = binary_path
+            with _BINARY_CACHE_LOCK:
+                _BINARY_CACHE[self.binary_name] = binary_path
+            return
 
         logger.warning(f"Binary {self.binary_name} not found in PATH")
+        with _BINARY_CACHE_LOCK:
+            _BINARY_CACHE[self.binary_name] = None
         self.use_container = True
 
+    @cached_property
+    def version(self) -> Optional[str]:
+        """Get the tool version, probing the binary on first access.
+
+        Returns:
+            Version string, or None if the binary is missing or the probe fails
+        """
+        if not self.binary_path:
+            return None
+
+        try:
+            return self._get_version()
+        except Exception as e:
+            logger.warning(f"Failed to get version for {self.name}: {e}")
+            return None
+
     def _get_version(self) -> str:
         """Get the tool version.
 
@@ -94,6 +343,12 @@ class ToolIntegration(ABC):
         if not self.binary_path:
             raise ToolExecutionError(f"Binary for {self.name} not found")
 
+        key = (self.binary_path, tuple(self.version_args))
+        with _VERSION_CACHE_LOCK:
+            cached = _VERSION_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         try:
             result = subprocess.run(
                 [self.binary_path] + self.version_args,
@@ -101,9 +356,10 @@ class ToolIntegration(ABC):
                 text=True,
                 check=True,
                 timeout=30,  # Add timeout to prevent hanging
+                close_fds=False,
             )
 
-            return result.stdout.strip()
+            version = result.stdout.strip()
         except subprocess.SubprocessError as e:
             raise ToolExecutionError(f"Failed to get version for {self.name}: {e}")
         except Exception as e:
@@ -111,6 +367,10 @@ class ToolIntegration(ABC):
                 f"Unexpected error getting version for {self.name}: {e}"
             )
 
+        with _VERSION_CACHE_LOCK:
+            _VERSION_CACHE[key] = version
+        return version
+
     def build_command(self, *args: str, **kwargs: Any) -> List[str]:
         """Build a command for the tool.
 
@@ -124,20 +384,138 @@ class ToolIntegration(ABC):
         Raises:
             ToolExecutionError: If the command cannot be built
         """
+        return [*self._command_prefix(), *args]
+
+    def _command_prefix(self) -> Tuple[str, ...]:
+        """Get the fixed part of the tool's command line.
+
+        The prefix is specialized once for the current binary/container setup
+        and rebuilt only if ``binary_path``, ``use_container`` or
+        ``container_image`` change afterwards.
+
+        Returns:
+            Command prefix as a tuple of strings
+
+        Raises:
+            ToolExecutionError: If the command cannot be built
+        """
+        state = (self.binary_path, self.use_container, self.container_image)
+        if state == self._prefix_state:
+            return self._prefix
+
         if self.binary_path:
-            return [self.binary_path] + self.default_args + list(args)
-
-        if self.use_container and self.container_image:
-            return (
-                ["docker", "run", "--rm"]
-                + self.container_options
-                + [self.container_image]
-                + self.default_args
-                + list(args)
+            prefix: Tuple[str, ...] = (self.binary_path, *self._default_args)
+        elif self.use_container and self.container_image:
+            prefix = (
+                "docker",
+                "run",
+                "--rm",
+                *self._container_options,
+                self.container_image,
+                *self._default_args,
+            )
+        else:
+            raise ToolExecutionError(
+                f"Cannot build command for {self.name}: binary not found and container not configured"
             )
 
-        raise ToolExecutionError(
-            f"Cannot build command for {self.name}: binary not found and container not configured"
+        self._prefix_state = state
+        self._prefix = prefix
+        return prefix
+
+    def _build_result(
+        self,
+        cmd: List[str],
+        start_time: datetime,
+        start_ns: int,
+        exit_code: int,
+        stdout_str: Optional[Union[str, bytes]],
+        stderr_str: str,
+        stdout_path: Optional[str] = None,
+        parse_on_error: bool = False,
+        output_file: Optional[str] = None,
+    ) -> ToolResult:
+        """Parse the output of a finished command.
+
+        Args:
+            cmd: Command that was run
+            start_time: Time the command was started
+            start_ns: Monotonic clock reading when the command was started
+            exit_code: Process exit code
+            stdout_str: Captured standard output (bytes when requested with
+                ``binary_stdout``), or None if it was streamed
+            stderr_str: Captured standard error
+            stdout_path: File holding standard output when streamed
+            parse_on_error: Parse the output even if the command failed
+            output_file: File the tool wrote its output to, parsed in place
+                of standard output
+
+        Returns:
+            ToolResult containing the execution result
+        """
+        end_time = _end_time(start_time, start_ns)
+        status = "success" if exit_code == 0 else "error"
+
+        # Parse the result, skipping failed runs so the error is not masked
+        parsed_result = None
+        if status == "success" or parse_on_error:
+            try:
+                if parse_path := output_file or stdout_path:
+                    parsed_result = self.parse_output_from_file(
+                        parse_path, stderr_str
+                    )
+                else:
+                    parsed_result = self.parse_output(stdout_str or "", stderr_str)
+            except Exception as e:
+                logger.error(f"Failed to parse output: {e}")
+                status = "parse_error"
+
+        return ToolResult(
+            tool_name=self.name,
+            command=cmd,
+            status=status,
+            start_time=start_time,
+            end_time=end_time,
+            exit_code=exit_code,
+            stdout=stdout_str,
+            stderr=stderr_str,
+            parsed_result=parsed_result,
+            stdout_path=stdout_path,
+        )
+
+    def _failed_result(
+        self,
+        cmd: List[str],
+        start_time: datetime,
+        start_ns: int,
+        status: str,
+        stderr: str,
+        stdout_path: Optional[str] = None,
+    ) -> ToolResult:
+        """Build the result for a command that timed out or could not run.
+
+        Args:
+            cmd: Command that was run
+            start_time: Time the command was started
+            start_ns: Monotonic clock reading when the command was started
+            status: Result status ("timeout" or "error")
+            stderr: Error message
+            stdout_path: File holding standard output when streamed
+
+        Returns:
+            ToolResult describing the failure
+        """
+        return ToolResult(
+            tool_name=self.name,
+            command=cmd,
+            status=status,
+            start_time=start_time,
+            end_time=_end_time(start_time, start_ns),
+            exit_code=None,
+            stdout=None,
+            stderr=stderr,
+            parsed_result=None,
+            stdout_path=stdout_path,
         )
 
     async def run_async(self, *args: str, **kwargs: Any) -> ToolResult:
@@ -146,6 +524,18 @@ class ToolIntegration(ABC):
         Args:
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
+                - timeout: Timeout in seconds (default: 600)
+                - stream: Write stdout to a temporary file instead of
+                  buffering it in memory (default: False). The file path is
+                  returned in ``ToolResult.stdout_path`` and the caller is
+                  responsible for removing it.
+                - parse_on_error: Parse the output even if the tool exits with a
+                  non-zero status (default: False)
+                - binary_stdout: Keep stdout as undecoded bytes, both in the
+                  result and when passed to ``parse_output`` (default: False)
+                - output_file: Path the tool was told to write its output to;
+                  it is parsed with ``parse_output_from_file`` instead of
+                  stdout (default: None)
 
         Returns:
             ToolResult containing the execution result
@@ -154,54 +544,52 @@ class ToolIntegration(ABC):
             ToolExecutionError: If the command cannot be built
         """
         timeout = kwargs.pop("timeout", 600)  # Default timeout: 10 minutes
+        stream = kwargs.pop("stream", False)
+        parse_on_error = kwargs.pop("parse_on_error", False)
+        binary_stdout = kwargs.pop("binary_stdout", False)
+        output_file = kwargs.pop("output_file", None)
 
         cmd = self.build_command(*args)
-        cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
 
-        start_time = datetime.now()
+        start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Running command: {shlex.join(cmd)}")
 
-        logger.info(f"Running command: {cmd_str}")
+        stdout_path: Optional[str] = None
 
         try:
-            # Create a subprocess
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            # Send stdout straight to a file when streaming
+            stdout_target: Any = asyncio.subprocess.PIPE
+            if stream:
+                stdout_target, stdout_path = tempfile.mkstemp(
+                    prefix=f"{self.name}_", suffix=".out"
+                )
 
-            # Wait for the subprocess to finish with timeout
+            # Create a subprocess
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=stdout_target,
+                    stderr=asyncio.subprocess.PIPE,
+                    close_fds=False,
                 )
+            finally:
+                if stream:
+                    os.close(stdout_target)
 
-                end_time = datetime.now(timezone.utc)
-                stdout_str = stdout.decode("utf-8", errors="replace")
-                stderr_str = stderr.decode("utf-8", errors="replace")
-
-                status = "success" if process.returncode == 0 else "error"
-
-                # Parse the result
-                parsed_result = None
-                try:
-                    parsed_result = self.parse_output(stdout_str, stderr_str)
-                except Exception as e:
-                    logger.error(f"Failed to parse output: {e}")
-                    status = "parse_error"
-
-                return ToolResult(
-                    tool_name=self.name,
-                    command=cmd_str,
-                    status=status,
-                    start_time=start_time,
-                    end_time=end_time,
-                    exit_code=process.returncode,
-                    stdout=stdout_str,
-                    stderr=stderr_str,
-                    parsed_result=parsed_result,
+            # Decode output as it arrives and wait for the subprocess to finish
+            read_stdout = _read_bytes if binary_stdout else _read_text
+            try:
+                stdout_str, stderr_str, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        read_stdout(process.stdout),
+                        _read_text(process.stderr),
+                        process.wait(),
+                    ),
+                    timeout=timeout,
                 )
-
             except asyncio.TimeoutError:
                 # Kill the process if it times out
                 try:
@@ -209,53 +597,143 @@ class ToolIntegration(ABC):
                 except:  # noqa
                     pass
 
-                end_time = datetime.now(timezone.utc)
-                return ToolResult(
-                    tool_name=self.name,
-                    command=cmd_str,
-                    status="timeout",
-                    start_time=start_time,
-                    end_time=end_time,
-                    exit_code=None,
-                    stdout=None,
-                    stderr=f"Command timed out after {timeout} seconds",
-                    parsed_result=None,
+                return self._failed_result(
+                    cmd,
+                    start_time,
+                    start_ns,
+                    "timeout",
+                    f"Command timed out after {timeout} seconds",
+                    stdout_path,
                 )
 
+            return self._build_result(
+                cmd,
+                start_time,
+                start_ns,
+                process.returncode if process.returncode is not None else -1,
+                stdout_str,
+                stderr_str or "",
+                stdout_path,
+                parse_on_error,
+                output_file,
+            )
+
         except Exception as e:
-            end_time = datetime.now(timezone.utc)
             logger.error(f"Failed to run command: {e}")
-
-            return ToolResult(
-                tool_name=self.name,
-                command=cmd_str,
-                status="error",
-                start_time=start_time,
-                end_time=end_time,
-                exit_code=None,
-                stdout=None,
-                stderr=str(e),
-                parsed_result=None,
+            return self._failed_result(
+                cmd, start_time, start_ns, "error", str(e), stdout_path
             )
 
     def run(self, *args: str, **kwargs: Any) -> ToolResult:
         """Run the tool synchronously.
 
+        This blocks on the subprocess directly rather than spinning up an
+        event loop; use ``run_async`` from coroutines.
+
         Args:
             *args: Additional positional arguments
-            **kwargs: Additional keyword arguments
+            **kwargs: Additional keyword arguments (see ``run_async``)
 
         Returns:
             ToolResult containing the execution result
+
+        Raises:
+            ToolExecutionError: If the command cannot be built
         """
-        return asyncio.run(self.run_async(*args, **kwargs))
+        timeout = kwargs.pop("timeout", 600)  # Default timeout: 10 minutes
+        stream = kwargs.pop("stream", False)
+        parse_on_error = kwargs.pop("parse_on_error", False)
+        binary_stdout = kwargs.pop("binary_stdout", False)
+        output_file = kwargs.pop("output_file", None)
+
+        cmd = self.build_command(*args)
+
+        start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Running command: {shlex.join(cmd)}")
+
+        stdout_path: Optional[str] = None
+
+        try:
+            # Send stdout straight to a file when streaming
+            stdout_target: Any = subprocess.PIPE
+            if stream:
+                stdout_target, stdout_path = tempfile.mkstemp(
+                    prefix=f"{self.name}_", suffix=".out"
+                )
+
+            try:
+                completed = subprocess.run(
+                    cmd,
+                    stdout=stdout_target,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout,
+                    close_fds=False,
+                )
+            finally:
+                if stream:
+                    os.close(stdout_target)
+
+        except subprocess.TimeoutExpired:
+            return self._failed_result(
+                cmd,
+                start_time,
+                start_ns,
+                "timeout",
+                f"Command timed out after {timeout} seconds",
+                stdout_path,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to run command: {e}")
+            return self._failed_result(
+                cmd, start_time, start_ns, "error", str(e), stdout_path
+            )
+
+        stdout_bytes: Optional[bytes] = completed.stdout
+        stdout_str: Optional[Union[str, bytes]] = stdout_bytes
+        if stdout_bytes is not None and not binary_stdout:
+            stdout_str = stdout_bytes.decode("utf-8", errors="replace")
+
+        return self._build_result(
+            cmd,
+            start_time,
+            start_ns,
+            completed.returncode,
+            stdout_str,
+            completed.stderr.decode("utf-8", errors="replace"),
+            stdout_path,
+            parse_on_error,
+            output_file,
+        )
+
+    def submit(self, *args: str, **kwargs: Any) -> "Future[ToolResult]":
+        """Start the tool in the background without blocking.
+
+        The run is scheduled on a shared event loop that lives in a helper
+        thread, so many tool runs can be in flight at once from synchronous
+        code without creating an event loop per call.
+
+        Args:
+            *args: Additional positional arguments
+            **kwargs: Additional keyword arguments (see ``run_async``)
+
+        Returns:
+            Future resolving to the ToolResult
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.run_async(*args, **kwargs), _background_loop()
+        )
 
     @abstractmethod
-    def parse_output(self, stdout: str, stderr: str) -> Dict[str, Any]:
+    def parse_output(self, stdout: Union[str, bytes], stderr: str) -> Dict[str, Any]:
         """Parse the tool output.
 
         Args:
-            stdout: Standard output from the tool
+            stdout: Standard output from the tool, as undecoded bytes when the
+                tool was run with ``binary_stdout``
             stderr: Standard error from the tool
 
         Returns:
@@ -266,6 +744,78 @@ class ToolIntegration(ABC):
         """
         raise NotImplementedError("Tool integration must implement parse_output")
 
+    def parse_output_from_file(self, path: str, stderr: str) -> Dict[str, Any]:
+        """Parse tool output that was streamed to a file.
+
+        Integrations whose parsers can consume a file directly should override
+        this to avoid loading the whole output into memory.
+
+        Args:
+            path: Path to the file holding standard output
+            stderr: Standard error from the tool
+
+        Returns:
+            Parsed output as a dictionary
+
+        Raises:
+            OutputParsingError: If parsing fails
+        """
+        return self.parse_output(OutputHelper.read_file(path), stderr)
+
+
+async def _probe_version(binary_path: str, version_args: Tuple[str, ...]) -> None:
+    """Run a version probe and store its output in the version cache.
+
+    Args:
+        binary_path: Path to the tool binary
+        version_args: Arguments that make the tool print its version
+    """
+    key = (binary_path, version_args)
+    with _VERSION_CACHE_LOCK:
+        if key in _VERSION_CACHE:
+            return
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            binary_path,
+            *version_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
+        )
+    except OSError as e:
+        logger.warning(f"Failed to probe version of {binary_path}: {e}")
+        return
+
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        process.kill()
+        logger.warning(f"Version probe of {binary_path} timed out")
+        return
+
+    # Failed probes are left for _get_version to report
+    if process.returncode == 0:
+        with _VERSION_CACHE_LOCK:
+            _VERSION_CACHE[key] = stdout.decode("utf-8", errors="replace").strip()
+
+
+async def warmup_versions(integrations: Iterable[ToolIntegration]) -> None:
+    """Probe the versions of several tool integrations concurrently.
+
+    Startup takes as long as the slowest probe rather than the sum of all of
+    them; afterwards each integration's ``version`` is served from the cache.
+
+    Args:
+        integrations: Integrations whose versions should be probed
+    """
+    keys = {
+        (integration.binary_path, tuple(integration.version_args))
+        for integration in integrations
+        if integration.binary_path
+    }
+    await asyncio.gather(*(_probe_version(path, args) for path, args in keys))
+
 
 class DockerToolIntegration(ToolIntegration):
     """Base class for Docker-based tool integrations."""
@@ -276,19 +826,140 @@ class DockerToolIntegration(ToolIntegration):
         self.use_container = True
 
         # Check if Docker is available
+        self.docker_version = _docker_version()
+        if self.docker_version is None:
+            self.use_container = False
+
+    def _container_key(self) -> Tuple[str, Tuple[str, ...]]:
+        """Get the key identifying this integration's shared container.
+
+        Returns:
+            Tuple of (container image, container options)
+
+        Raises:
+            ToolExecutionError: If no container image is defined
+        """
+        if not self.container_image:
+            raise ToolExecutionError(f"No container image defined for {self.name}")
+        return self.container_image, self._container_options
+
+    def _get_container(self) -> Optional[str]:
+        """Get a running container for the tool, starting one if needed.
+
+        Containers are shared by all integrations with the same image and
+        options, and are removed when the interpreter exits. A cached container
+        that has stopped is replaced.
+
+        Returns:
+            Docker container ID, or None if the image cannot be kept running
+
+        Raises:
+            ToolExecutionError: If the container cannot be started
+        """
+        key = self._container_key()
+
+        with _CONTAINERS_LOCK:
+            start_lock = _CONTAINER_START_LOCKS.setdefault(key, threading.Lock())
+
+        with start_lock:
+            with _CONTAINERS_LOCK:
+                cached = key in _CONTAINERS
+                container_id = _CONTAINERS.get(key)
+
+            if cached:
+                if container_id is None or _container_running(container_id):
+                    return container_id
+                logger.info(f"Container {container_id} for {self.name} has stopped")
+
+            container_id = self._start_container()
+            with _CONTAINERS_LOCK:
+                _CONTAINERS[key] = container_id
+            return container_id
+
+    def _start_container(self) -> Optional[str]:
+        """Start a long-lived container that idles until commands are exec'd.
+
+        Returns:
+            Docker container ID, or None if the image cannot run ``sleep``
+            (distroless and scratch images, for example)
+
+        Raises:
+            ToolExecutionError: If Docker cannot be run or no container image
+                is defined
+        """
+        image, container_options = self._container_key()
         try:
             result = subprocess.run(
-                ["docker", "--version"],
+                [
+                    "docker",
+                    "run",
+                    "-d",
+                    "--rm",
+                    "--entrypoint",
+                    "sleep",
+                    *container_options,
+                    image,
+                    "infinity",
+                ],
                 capture_output=True,
                 text=True,
                 check=True,
-                timeout=10,
+                timeout=120,
+                close_fds=False,
             )
-            self.docker_version = result.stdout.strip()
+        except subprocess.CalledProcessError as e:
+            logger.warning(
+                f"Cannot keep a container running for {self.name}, "
+                f"running one container per command: {e.stderr or e}"
+            )
+            return None
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            logger.error(f"Docker not found or not available: {e}")
-            self.docker_version = None
-            self.use_container = False
+            raise ToolExecutionError(
+                f"Failed to start container for {self.name}: {e}"
+            )
+
+        return str(result.stdout).strip()
+
+    def build_command(self, *args: str, **kwargs: Any) -> List[str]:
+        """Build a command, running it inside the tool's shared container.
+
+        A locally installed binary is preferred over the container. Images
+        that cannot be kept running fall back to ``docker run --rm``.
+
+        Args:
+            *args: Additional positional arguments
+            **kwargs: Additional keyword arguments
+
+        Returns:
+            Command as a list of strings
+
+        Raises:
+            ToolExecutionError: If the command cannot be built
+        """
+        if not self.binary_path and self.use_container and self.container_image:
+            container_id = self._get_container()
+            if container_id:
+                return [
+                    "docker",
+                    "exec",
+                    container_id,
+                    self.binary_name,
+                    *self._default_args,
+                    *args,
+                ]
+
+        return super().build_command(*args, **kwargs)
+
+    def close(self) -> None:
+        """Remove the shared container used by this integration, if any."""
+        if not self.container_image:
+            return
+
+        with _CONTAINERS_LOCK:
+            container_id = _CONTAINERS.pop(self._container_key(), None)
+
+        if container_id:
+            _remove_container(container_id)
 
     def _get_version(self) -> str:
         """Get the tool version from the Docker container.
@@ -309,6 +980,7 @@ class DockerToolIntegration(ToolIntegration):
                 text=True,
                 check=True,
                 timeout=30,
+                close_fds=False,
             )
 
             return result.stdout.strip()
@@ -329,12 +1001,25 @@ class CommandBuilder:
         Args:
             base_command: Base command as a string or list of strings
         """
+        self.command: List[str] = []
+        self.args: List[str] = []
+        self.reset(base_command)
+
+    def reset(self, base_command: Union[str, List[str]]) -> "CommandBuilder":
+        """Clear the builder in place so it can be reused for a new command.
+
+        Args:
+            base_command: Base command as a string or list of strings
+
+        Returns:
+            Self for chaining
+        """
         if isinstance(base_command, str):
-            self.command = [base_command]
+            self.command[:] = (base_command,)
         else:
-            self.command = base_command.copy()
-
-        self.args: List[str] = []
+            self.command[:] = base_command
+        self.args.clear()
+        return self
 
     def add_arg(self, arg: str) -> "CommandBuilder":
         """Add a simple argument.
@@ -371,6 +1056,41 @@ class CommandBuilder:
 
         return self
 
+    def extend_args(self, args: Iterable[str]) -> "CommandBuilder":
+        """Add several simple arguments at once.
+
+        Args:
+            args: Arguments to add
+
+        Returns:
+            Self for chaining
+        """
+        self.args.extend(args)
+        return self
+
+    def extend_flags(
+        self, flags: Mapping[str, Optional[Union[str, int, bool]]]
+    ) -> "CommandBuilder":
+        """Add several flags at once.
+
+        Values follow the same rules as ``add_flag``: None or True adds the
+        bare flag, False skips it, and any other value is added after the flag.
+
+        Args:
+            flags: Mapping of flag names to values
+
+        Returns:
+            Self for chaining
+        """
+        out: List[str] = []
+        for flag, value in flags.items():
+            if value is None or value is True:
+                out.append(flag)
+            elif value is not False:
+                out += (flag, str(value))
+        self.args.extend(out)
+        return self
+
     def add_key_value(
         self, key: str, value: Union[str, int], separator: str = "="
     ) -> "CommandBuilder":
@@ -401,7 +1121,7 @@ class CommandBuilder:
         Returns:
             Command as a string
         """
-        return " ".join(shlex.quote(arg) for arg in self.build())
+        return shlex.join(self.build())
 
 
 class OutputParser(ABC):
@@ -441,9 +1161,22 @@ class OutputHelper:
         Returns:
             Tuple of (file name, file path)
         """
+        data = content.encode("utf-8")
         fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix)
-        with os.fdopen(fd, "w") as f:
-            f.write(content)
+        try:
+            # Reserve the space up front, then write the bytes directly
+            if data and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, len(data))
+                except OSError:
+                    pass  # Not supported by every filesystem
+
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
 
         return os.path.basename(path), path
 
@@ -460,5 +1193,32 @@ class OutputHelper:
         Raises:
             FileNotFoundError: If the file does not exist
         """
-        with open(path, "r") as f:
-            return f.read()
\ No newline at end of file
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    @staticmethod
+    @contextmanager
+    def map_file(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+        """Memory-map a file for read-only, zero-copy access.
+
+        Parsers that accept bytes-like input can consume the mapping directly
+        instead of reading and decoding the whole file first. The mapping is
+        only valid inside the ``with`` block.
+
+        Args:
+            path: File path
+
+        Yields:
+            Read-only memory map of the file (empty bytes for an empty file)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be memory-mapped
+                yield b""
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
\ No newline at end of file
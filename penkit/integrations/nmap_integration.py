@@ -1,12 +1,35 @@
 """Nmap integration for PenKit."""
 
+import io
+import logging
+import os
 import re
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from collections import Counter
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from penkit.core.exceptions import IntegrationError, OutputParsingError
 from penkit.core.models import Host, HostStatus, Port
-from penkit.integrations.base import CommandBuilder, ToolIntegration
+from penkit.integrations.base import ToolIntegration
+
+# Prefer libxml2 when lxml is installed; its API is a superset of ElementTree
+# for everything used here. XMLSyntaxError subclasses lxml's ParseError.
+# lxml can also filter events by tag in C, so only the elements the parser
+# looks at reach Python; the stdlib reports every element.
+try:
+    from lxml import etree as ET
+
+    _ITERPARSE_OPTIONS: Dict[str, Any] = {
+        "tag": ("nmaprun", "host", "finished"),
+        "huge_tree": True,
+        "resolve_entities": False,
+    }
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+
+    _ITERPARSE_OPTIONS = {}
+
+logger = logging.getLogger(__name__)
 
 
 class NmapIntegration(ToolIntegration):
@@ -21,6 +44,23 @@ class NmapIntegration(ToolIntegration):
     container_options = ["--net=host"]
     # Define version_pattern as class variable, not instance variable
     version_pattern = re.compile(r"Nmap version ([0-9.]+)")
+    _VERSION_PREFIX = "Nmap version "
+    _VERSION_CHARS = "0123456789."
+
+    # Element paths used by the host/port parsers; ElementPath compiles each
+    # distinct path once, so these are shared rather than rebuilt per call
+    _STATUS_PATH = "./status"
+    _ADDRESS_PATH = "./address"
+    _USER_HOSTNAME_PATH = "./hostnames/hostname[@type='user']"
+    _OSMATCH_PATH = "./os/osmatch"
+    _NAMED_OSMATCH_PATH = "./os/osmatch[@name]"
+    _PORT_PATH = "./ports/port"
+    _STATE_PATH = "./state"
+    _SERVICE_PATH = "./service"
+    _BANNER_PATH = "./script[@id='banner']"
+
+    # Nmap host states that map onto a known HostStatus
+    _STATUS_MAP = {"up": HostStatus.UP, "down": HostStatus.DOWN}
 
     def __init__(self) -> None:
         """Initialize the Nmap integration."""
@@ -42,6 +82,13 @@ class NmapIntegration(ToolIntegration):
             raise IntegrationError("Nmap binary not found")
 
         result = super()._get_version()
+
+        # Nmap prints "Nmap version X.Y ..." first; avoid the regex for it
+        if result.startswith(self._VERSION_PREFIX):
+            fields = result[len(self._VERSION_PREFIX) :].split(None, 1)
+            if fields and not fields[0].strip(self._VERSION_CHARS):
+                return fields[0]
+
         match = self.version_pattern.search(result)
         if match:
             return match.group(1)
@@ -73,52 +120,44 @@ class NmapIntegration(ToolIntegration):
         if not target:
             raise IntegrationError("Target is required for Nmap scan")
 
-        cmd_builder = CommandBuilder([self.binary_name if self.binary_path else "nmap"])
-
-        # Add output format (XML for parsing)
-        cmd_builder.add_flag("-oX", "-")
-
-        # Add ports if specified
-        if "ports" in options and options["ports"]:
-            cmd_builder.add_flag("-p", options["ports"])
-
-        # Add service detection
+        # Add output format (XML for parsing); when a file is requested a local
+        # nmap writes it directly and the scan is parsed from there. A container
+        # has no view of the host filesystem, so there the XML is captured from
+        # stdout and saved afterwards.
+        output_xml = options.get("output_xml")
+        direct_xml = output_xml if self.binary_path else None
+        argv = ["-oX", direct_xml or "-"]
+
+        # Add ports, detection, scripts and timing if specified
+        if ports := options.get("ports"):
+            argv += ("-p", str(ports))
         if options.get("service_detection", False):
-            cmd_builder.add_flag("-sV")
-
-        # Add OS detection
+            argv.append("-sV")
         if options.get("os_detection", False):
-            cmd_builder.add_flag("-O")
-
-        # Add script scan if enabled
+            argv.append("-O")
         if options.get("script_scan", False):
-            cmd_builder.add_flag("-sC")
-
-        # Add script
-        if "script" in options and options["script"]:
-            cmd_builder.add_flag("--script", options["script"])
-
-        # Add timing template
-        if "timing" in options and options["timing"]:
-            cmd_builder.add_flag("-T", options["timing"])
+            argv.append("-sC")
+        if script := options.get("script"):
+            argv += ("--script", str(script))
+        if timing := options.get("timing"):
+            argv += ("-T", str(timing))
 
-        # Add additional arguments
-        for arg in args:
-            cmd_builder.add_arg(arg)
-
-        # Add target
-        cmd_builder.add_arg(target)
+        # Add additional arguments and the target
+        argv.extend(args)
+        argv.append(target)
 
         # Extract timeout from options if present
         timeout = options.get("timeout", 600)
 
-        # Run the scan
-        result = self.run(*cmd_builder.build()[1:], timeout=timeout)
-
-        # Save XML output if requested
-        if "output_xml" in options and result.stdout:
-            with open(options["output_xml"], "w") as f:
-                f.write(result.stdout)
+        # Run the scan, keeping captured XML as bytes for the parser
+        if direct_xml:
+            result = self.run(*argv, timeout=timeout, output_file=direct_xml)
+        else:
+            result = self.run(*argv, timeout=timeout, binary_stdout=True)
+            if output_xml and result.stdout:
+                stdout = result.stdout
+                with open(output_xml, "wb") as f:
+                    f.write(stdout if isinstance(stdout, bytes) else stdout.encode())
 
         # Check for errors
         if result.status == "error":
@@ -132,11 +171,11 @@ class NmapIntegration(ToolIntegration):
 
         return result.parsed_result or {}
 
-    def parse_output(self, stdout: str, stderr: str) -> Dict[str, Any]:
+    def parse_output(self, stdout: Union[str, bytes], stderr: str) -> Dict[str, Any]:
         """Parse Nmap XML output.
 
         Args:
-            stdout: Nmap XML output
+            stdout: Nmap XML output, preferably as undecoded bytes
             stderr: Standard error from Nmap
 
         Returns:
@@ -150,6 +189,9 @@ class NmapIntegration(ToolIntegration):
                 raise OutputParsingError(f"No output from Nmap: {stderr}")
             raise OutputParsingError("No output from Nmap")
 
+        if isinstance(stdout, str):
+            stdout = stdout.encode("utf-8")
+
         try:
             return self._parse_xml(stdout)
         except ET.ParseError as e:
@@ -157,11 +199,41 @@ class NmapIntegration(ToolIntegration):
         except Exception as e:
             raise OutputParsingError(f"Unexpected error parsing Nmap output: {e}")
 
-    def _parse_xml(self, xml_output: str) -> Dict[str, Any]:
+    def parse_output_from_file(self, path: str, stderr: str) -> Dict[str, Any]:
+        """Parse Nmap XML output that was streamed to a file.
+
+        Args:
+            path: Path to the file holding Nmap XML output
+            stderr: Standard error from Nmap
+
+        Returns:
+            Parsed output as a dictionary
+
+        Raises:
+            OutputParsingError: If parsing fails
+        """
+        if not os.path.isfile(path) or not os.path.getsize(path):
+            if stderr:
+                raise OutputParsingError(f"No output from Nmap: {stderr}")
+            raise OutputParsingError("No output from Nmap")
+
+        try:
+            return self._iterparse_xml(path)
+        except ET.ParseError as e:
+            raise OutputParsingError(f"Failed to parse Nmap XML output: {e}")
+        except Exception as e:
+            raise OutputParsingError(f"Unexpected error parsing Nmap output: {e}")
+
+    def _parse_xml(self, xml_output: Union[str, bytes]) -> Dict[str, Any]:
         """Parse Nmap XML output.
 
+        The document is streamed with ``iterparse`` and each host element is
+        released once parsed, so memory stays bounded by a single host rather
+        than the whole scan.
+
         Args:
-            xml_output: Nmap XML output
+            xml_output: Nmap XML output; ``str`` input is encoded first, so
+                callers should pass the raw bytes where they have them
 
         Returns:
             Parsed output as a dictionary
@@ -170,66 +242,115 @@ class NmapIntegration(ToolIntegration):
             ET.ParseError: If XML parsing fails
             OutputParsingError: If output parsing fails
         """
-        try:
-            root = ET.fromstring(xml_output)
+        if isinstance(xml_output, str):
+            xml_output = xml_output.encode("utf-8")
 
-            result: Dict[str, Any] = {
-                "scan_info": {},
-                "hosts": [],
-            }
+        return self._iterparse_xml(io.BytesIO(xml_output))
 
-            # Parse scan information
-            if scanner := root.find("./scanner"):
-                result["scan_info"]["scanner"] = scanner.get("name", "")
-                result["scan_info"]["version"] = scanner.get("version", "")
+    def _iterparse_xml(self, source: Union[str, BinaryIO]) -> Dict[str, Any]:
+        """Stream-parse Nmap XML from a file path or binary file object.
 
-            if run_stats := root.find("./runstats/finished"):
-                result["scan_info"]["time"] = run_stats.get("time", "")
-                result["scan_info"]["elapsed"] = run_stats.get("elapsed", "")
-                result["scan_info"]["exit"] = run_stats.get("exit", "")
-                result["scan_info"]["summary"] = run_stats.get("summary", "")
+        Args:
+            source: Path to an XML file or a binary file object
 
-            # Parse hosts
-            hosts: List[Host] = []
-            for host_elem in root.findall("./host"):
-                host = self._parse_host(host_elem)
-                if host:
-                    hosts.append(host)
+        Returns:
+            Parsed output as a dictionary
 
-            # Convert Host objects to dictionaries
-            result["hosts"] = [host.dict() for host in hosts]
+        Raises:
+            ET.ParseError: If XML parsing fails
+            OutputParsingError: If output parsing fails
+        """
+        try:
+            result: Dict[str, Any] = {
+                "scan_info": {},
+                "hosts": [],
+            }
+            scan_info = result["scan_info"]
+
+            # Parsed fields are merged over the JSON form of the model defaults
+            # so each host is not validated only to be dumped straight back
+            host_defaults = Host(ip_address="").model_dump(mode="json")
+            port_defaults = Port(port=0, protocol="").model_dump(mode="json")
+            mutable_fields = [
+                field
+                for field, value in host_defaults.items()
+                if isinstance(value, (list, dict))
+            ]
+
+            hosts_data = result["hosts"]
+
+            def add_host(host: Optional[Dict[str, Any]]) -> None:
+                if not host:
+                    return
+                host_dict = {**host_defaults, **host}
+                for field in mutable_fields:
+                    if field not in host:
+                        host_dict[field] = type(host_defaults[field])()
+                host_dict["open_ports"] = [
+                    {**port_defaults, **port} for port in host["open_ports"]
+                ]
+                hosts_data.append(host_dict)
+
+            root: Optional[ET.Element] = None
+            depth = 0
+            for event, elem in ET.iterparse(
+                source, events=("start", "end"), **_ITERPARSE_OPTIONS
+            ):
+                if event == "start":
+                    depth += 1
+                    if root is None:
+                        # Scanner details are attributes of the root
+                        root = elem
+                        scan_info["scanner"] = elem.get("scanner", "")
+                        scan_info["version"] = elem.get("version", "")
+                    continue
+
+                depth -= 1
+                if elem.tag == "host" and depth == 1:
+                    add_host(self._parse_host_dict(elem))
+                    # Release the host along with any progress and verbose
+                    # elements before it so the tree never grows
+                    del root[:]
+                elif elem.tag == "finished":
+                    scan_info["time"] = elem.get("time", "")
+                    scan_info["elapsed"] = elem.get("elapsed", "")
+                    scan_info["exit"] = elem.get("exit", "")
+                    scan_info["summary"] = elem.get("summary", "")
 
             return result
-        except ET.ParseError as e:
-            raise ET.ParseError(f"XML parsing error: {e}")
+        except ET.ParseError:
+            raise
         except Exception as e:
             raise OutputParsingError(f"Error parsing Nmap output: {e}")
 
-    def _parse_host(self, host_elem: ET.Element) -> Optional[Host]:
-        """Parse a host element from Nmap XML.
+    def _parse_host_dict(self, host_elem: ET.Element) -> Optional[Dict[str, Any]]:
+        """Parse a host element from Nmap XML into plain fields.
 
         Args:
             host_elem: Host XML element
 
         Returns:
-            Host object or None if parsing fails
+            Host fields, with ports as dictionaries, or None if parsing fails
         """
         try:
             # Get host status
-            status_elem = host_elem.find("./status")
+            status_elem = host_elem.find(self._STATUS_PATH)
             status = HostStatus.UNKNOWN
             if status_elem is not None:
-                status_str = status_elem.get("state", "")
-                if status_str == "up":
-                    status = HostStatus.UP
-                elif status_str == "down":
-                    status = HostStatus.DOWN
+                status = self._STATUS_MAP.get(
+                    status_elem.get("state", ""), HostStatus.UNKNOWN
+                )
 
-            # Get IP address
+            # Get IP and MAC addresses in a single pass
             ip_address = ""
-            for addr_elem in host_elem.findall("./address"):
-                if addr_elem.get("addrtype") == "ipv4":
+            mac_address = None
+            for addr_elem in host_elem.iterfind(self._ADDRESS_PATH):
+                addr_type = addr_elem.get("addrtype")
+                if addr_type == "ipv4" and not ip_address:
                     ip_address = addr_elem.get("addr", "")
+                elif addr_type == "mac" and not mac_address:
+                    mac_address = addr_elem.get("addr")
+                if ip_address and mac_address:
                     break
 
             if not ip_address:
@@ -237,94 +358,97 @@ class NmapIntegration(ToolIntegration):
 
             # Get hostname
             hostname = None
-            for hostname_elem in host_elem.findall("./hostnames/hostname"):
-                if hostname_elem.get("type") == "user":
-                    hostname = hostname_elem.get("name")
-                    break
+            hostname_elem = host_elem.find(self._USER_HOSTNAME_PATH)
+            if hostname_elem is not None:
+                hostname = hostname_elem.get("name")
 
             # Get OS information
             os_info = None
-            for os_elem in host_elem.findall("./os/osmatch"):
-                if os_elem.get("name"):
-                    os_info = os_elem.get("name")
-                    break
-
-            # Get MAC address
-            mac_address = None
-            for addr_elem in host_elem.findall("./address"):
-                if addr_elem.get("addrtype") == "mac":
-                    mac_address = addr_elem.get("addr")
-                    break
+            os_elem = host_elem.find(self._NAMED_OSMATCH_PATH)
+            if os_elem is not None:
+                os_info = os_elem.get("name")
+            if not os_info:
+                # The first named match was empty; lxml's find() has no "!="
+                # predicate, so look for a non-empty name the long way
+                os_info = None
+                for os_elem in host_elem.iterfind(self._OSMATCH_PATH):
+                    if os_elem.get("name"):
+                        os_info = os_elem.get("name")
+                        break
 
             # Get open ports
-            ports: List[Port] = []
-            for port_elem in host_elem.findall("./ports/port"):
-                port = self._parse_port(port_elem)
+            ports: List[Dict[str, Any]] = []
+            for port_elem in host_elem.iterfind(self._PORT_PATH):
+                port = self._parse_port_dict(port_elem)
                 if port:
                     ports.append(port)
 
-            return Host(
-                ip_address=ip_address,
-                hostname=hostname,
-                os=os_info,
-                status=status,
-                mac_address=mac_address,
-                open_ports=ports,
-            )
+            return {
+                "ip_address": ip_address,
+                "hostname": hostname,
+                "os": os_info,
+                "status": status.value,
+                "mac_address": mac_address,
+                "open_ports": ports,
+            }
 
-        except Exception as e:
-            print(f"Error parsing host: {e}")
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Error parsing host: %s", e)
             return None
 
-    def _parse_port(self, port_elem: ET.Element) -> Optional[Port]:
-        """Parse a port element from Nmap XML.
+    def _parse_port_dict(self, port_elem: ET.Element) -> Optional[Dict[str, Any]]:
+        """Parse a port element from Nmap XML into plain fields.
 
         Args:
             port_elem: Port XML element
 
         Returns:
-            Port object or None if parsing fails
+            Port fields or None if parsing fails
         """
         try:
             port_id = port_elem.get("portid")
             if not port_id:
                 return None
 
-            protocol = port_elem.get("protocol", "")
+            # Protocol, state and service names repeat across every port, so
+            # intern them to keep one copy of each in the parsed results
+            protocol = sys.intern(port_elem.get("protocol", ""))
 
             # Get port state
-            state_elem = port_elem.find("./state")
+            state_elem = port_elem.find(self._STATE_PATH)
             state = "unknown"
             if state_elem is not None:
-                state = state_elem.get("state", "unknown")
+                state = sys.intern(state_elem.get("state", "unknown"))
 
             # Get service information
-            service_elem = port_elem.find("./service")
+            service_elem = port_elem.find(self._SERVICE_PATH)
             service = None
             version = None
             if service_elem is not None:
-                service = service_elem.get("name")
-                version = service_elem.get("product", "")
-                if product_version := service_elem.get("version"):
-                    version += f" {product_version}"
+                if service := service_elem.get("name"):
+                    service = sys.intern(service)
+                parts = (service_elem.get("product"), service_elem.get("version"))
+                version = " ".join(part for part in parts if part) or None
 
             # Get script output/banner
             banner = None
-            script_elem = port_elem.find("./script[@id='banner']")
+            script_elem = port_elem.find(self._BANNER_PATH)
             if script_elem is not None:
                 banner = script_elem.get("output")
 
-            return Port(
-                port=int(port_id),
-                protocol=protocol,
-                service=service,
-                version=version,
-                state=state,
-                banner=banner,
-            )
+            return {
+                "port": int(port_id),
+                "protocol": protocol,
+                "service": service,
+                "version": version,
+                "state": state,
+                "banner": banner,
+            }
 
-        except Exception as e:
-            print(f"Error parsing port: {e}")
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Error parsing port: %s", e)
             return None
 
     def quick_scan(self, target: str) -> Dict[str, Any]:
@@ -393,6 +517,33 @@ class NmapIntegration(ToolIntegration):
 
         return self.scan(target, **options)
 
+    def summarize(
+        self, scan_result: Dict[str, Any]
+    ) -> Tuple[Tuple[int, int, int], Dict[int, int]]:
+        """Get the host and port summaries of scan results in a single pass.
+
+        Args:
+            scan_result: Scan results
+
+        Returns:
+            Tuple of (host summary, port summary), as returned by
+            ``get_host_summary`` and ``get_port_summary``
+        """
+        port_count: Counter[int] = Counter()
+        total = up = 0
+
+        for host in scan_result.get("hosts", ()):
+            total += 1
+            if host.get("status") == "up":
+                up += 1
+            port_count.update(
+                port_num
+                for port in host.get("open_ports", ())
+                if (port_num := port.get("port", 0)) > 0
+            )
+
+        return (total, up, total - up), dict(port_count)
+
     def get_host_summary(self, scan_result: Dict[str, Any]) -> Tuple[int, int, int]:
         """Get a summary of hosts from scan results.
 
@@ -418,12 +569,4 @@ class NmapIntegration(ToolIntegration):
         Returns:
             Dictionary mapping port numbers to count of hosts with that port open
         """
-        port_count: Dict[int, int] = {}
-
-        for host in scan_result.get("hosts", []):
-            for port in host.get("open_ports", []):
-                port_num = port.get("port", 0)
-                if port_num > 0:
-                    port_count[port_num] = port_count.get(port_num, 0) + 1
-
-        return port_count
\ No newline at end of file
+        return self.summarize(scan_result)[1]
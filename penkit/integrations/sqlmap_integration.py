@@ -4,16 +4,218 @@ import json
 import os
 import re
 import tempfile
+import threading
+import uuid
 import logging
+from collections import Counter, deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 from penkit.core.exceptions import IntegrationError, OutputParsingError
-from penkit.core.models import Severity
-from penkit.integrations.base import CommandBuilder, ToolIntegration
+from penkit.core.models import Severity, ToolResult
+from penkit.integrations.base import CommandBuilder, OutputHelper, ToolIntegration
+
+# orjson can decode straight from a memory-mapped file; fall back to the
+# stdlib decoder when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# (binary path, binary mtime), or ("container:<image>", 0) in container mode,
+# -> whether that sqlmap supports --json-output
+_JSON_OUTPUT_SUPPORT: Dict[Tuple[str, int], bool] = {}
+_CAPABILITIES_LOCK = threading.Lock()
+
+# Lines of streamed stdout kept as raw_output in scan results
+RAW_OUTPUT_TAIL_LINES = 2000
+
+# Default scan output directory, created on first use
+_DEFAULT_OUTPUT_DIR: Optional[str] = None
+_OUTPUT_DIR_LOCK = threading.Lock()
+
+# Patterns used to parse SQLmap output, compiled once at import
+# Text output patterns are combined into one alternation so the output is
+# scanned once; the last named group of a match identifies its kind. Matches
+# never span lines, so output can also be fed a line at a time. The gap
+# between a parameter and its vulnerability type is matched lazily up to the
+# first "vulnerable to", so a line is walked forward once instead of being
+# backtracked from its end.
+_OUTPUT_RE = re.compile(
+    r"URL: (?P<url>https?://\S+)"
+    r"|[Pp]arameter '(?P<param>[^'\n]+)'[^\n]*?"
+    r"vulnerable to '?(?P<vuln_type>[^'\n]+)'?"
+    r"|scan spent (?P<scan_time>[0-9:]+)"
+)
+
+# SQL injection findings are reported as high severity
+_SEV_HIGH = Severity.HIGH
+
+# scan() options passed straight through as "<flag> <value>" when set
+_VALUE_OPTION_FLAGS = (
+    ("data", "--data"),
+    ("cookie", "--cookie"),
+    ("user_agent", "--user-agent"),
+    ("level", "--level"),
+    ("risk", "--risk"),
+    ("dbms", "--dbms"),
+    ("crawl", "--crawl"),
+    ("threads", "--threads"),
+)
+
+# Matched case-insensitively in place rather than lower-casing a copy
+_SCAN_DONE_RE = re.compile(r"scan completed", re.IGNORECASE)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _locate_json(buf: str) -> Optional[Dict[str, Any]]:
+    """Find the first JSON object in mixed output that holds scan data.
+
+    Each opening brace is tried in turn, decoding in place from there. Brace
+    blocks in log text that are not JSON, or JSON without a data object, are
+    stepped past one character at a time, so an unbalanced brace cannot hide
+    a later document.
+
+    Args:
+        buf: Output that may contain a JSON object among log lines
+
+    Returns:
+        The decoded object, or None if there is none
+    """
+    pos = buf.find("{")
+    while pos != -1:
+        try:
+            json_data, _ = _JSON_DECODER.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            json_data = None
+        if isinstance(json_data, dict) and _scan_data(json_data) is not None:
+            return json_data
+        pos = buf.find("{", pos + 1)
+    return None
+
+
+def _default_output_dir() -> str:
+    """Get the default SQLmap output directory, creating it once per process.
+
+    The directory lives in the user's home folder to ensure write permissions.
+
+    Returns:
+        Path to the default output directory
+    """
+    global _DEFAULT_OUTPUT_DIR
+    with _OUTPUT_DIR_LOCK:
+        if _DEFAULT_OUTPUT_DIR is None:
+            output_dir = os.path.join(
+                os.path.expanduser("~"), ".penkit", "sqlmap_output"
+            )
+            os.makedirs(output_dir, exist_ok=True)
+            _DEFAULT_OUTPUT_DIR = output_dir
+        return _DEFAULT_OUTPUT_DIR
+
+
+def _scan_data(data: Any) -> Optional[Dict[str, Any]]:
+    """Get the scan data object from decoded SQLmap JSON.
+
+    Args:
+        data: Decoded JSON document
+
+    Returns:
+        The document's data object, or None if it is missing or not an object
+    """
+    if isinstance(data, dict):
+        scan_data = data.get("data")
+        if isinstance(scan_data, dict):
+            return scan_data
+    return None
+
+
+def _load_json_file(path: str) -> Any:
+    """Load a JSON file, decoding it from a memory map when orjson is available.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        OSError: If the file cannot be read
+    """
+    if orjson is None:
+        with open(path, "rb") as f:
+            return json.load(f)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    with OutputHelper.map_file(path) as data:
+        with memoryview(data) as view:
+            return orjson.loads(view)
+
+
+class _TextOutputParser:
+    """Collect findings from SQLmap text output fed whole or in lines."""
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.target_url: Optional[str] = None
+        self.findings: List[Tuple[str, str]] = []
+        self.scan_time = ""
+        self.scan_completed = False
+
+    def feed(self, text: str) -> None:
+        """Scan a piece of output made up of complete lines.
+
+        Args:
+            text: SQLmap output
+        """
+        # The first URL and scan time win
+        for match in _OUTPUT_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "vuln_type":
+                self.findings.append((match["param"], match["vuln_type"]))
+            elif kind == "url":
+                if self.target_url is None:
+                    self.target_url = match["url"]
+                    logger.debug(f"Found target URL: {self.target_url}")
+            elif kind == "scan_time" and not self.scan_time:
+                self.scan_time = match["scan_time"]
+
+        if not self.scan_completed and _SCAN_DONE_RE.search(text):
+            self.scan_completed = True
+
+    def result(self) -> Dict[str, Any]:
+        """Build the parsed result from everything fed so far.
+
+        Returns:
+            Parsed data as a dictionary
+        """
+        # Build vulnerabilities once the URL is known
+        url = self.target_url if self.target_url else "Unknown"
+        vulnerabilities = [
+            {
+                "title": f"SQL Injection ({vuln_type})",
+                "description": f"SQL Injection vulnerability found in parameter '{param}'",
+                "severity": _SEV_HIGH,
+                "url": url,
+                "parameter": param,
+                "type": vuln_type,
+            }
+            for param, vuln_type in self.findings
+        ]
+
+        return {
+            "vulnerabilities": vulnerabilities,
+            "summary": {
+                "scan_time": self.scan_time,
+                "vulnerabilities_found": len(vulnerabilities),
+                "scan_completed": self.scan_completed,
+            },
+        }
+
+
 class SQLMapIntegration(ToolIntegration):
     """Integration for the SQLmap SQL injection scanner."""
 
@@ -31,13 +233,55 @@ class SQLMapIntegration(ToolIntegration):
         super().__init__()
         # Default to not supporting JSON output
         self._supports_json_output = False
-        
+
         # Only check capabilities if we found SQLMap
         if self.binary_path:
             self._check_capabilities()
     
+    def _command_builder(self, base_command: str) -> CommandBuilder:
+        """Get this thread's command builder, reset for a new command.
+
+        Args:
+            base_command: Base command to start the builder with
+
+        Returns:
+            Command builder holding only the base command
+        """
+        # Per-thread command builders, created on first use
+        builders = getattr(self, "_builders", None)
+        if builders is None:
+            builders = self._builders = threading.local()
+        builder = getattr(builders, "builder", None)
+        if builder is None:
+            builder = builders.builder = CommandBuilder(base_command)
+        else:
+            builder.reset(base_command)
+        return builder
+
     def _check_capabilities(self) -> None:
-        """Check SQLMap capabilities by testing help output."""
+        """Check SQLMap capabilities by testing help output.
+
+        The result is shared by every instance using the same, unmodified
+        binary or the same container image, so ``--help`` only runs once per
+        binary or image.
+        """
+        key: Optional[Tuple[str, int]] = None
+        if self.binary_path:
+            try:
+                key = (self.binary_path, os.stat(self.binary_path).st_mtime_ns)
+            except OSError:
+                pass
+        elif self.use_container and self.container_image:
+            # Containers have no binary to stat; key them by image name
+            key = ("container:" + self.container_image, 0)
+
+        if key is not None:
+            with _CAPABILITIES_LOCK:
+                cached = _JSON_OUTPUT_SUPPORT.get(key)
+            if cached is not None:
+                self._supports_json_output = cached
+                return
+
         try:
             # Check if --json-output is in the help text
             result = self.run("--help")
@@ -48,6 +292,11 @@ class SQLMapIntegration(ToolIntegration):
                 logger.debug("SQLMap does not support JSON output flag")
         except Exception as e:
             logger.warning(f"Error checking SQLMap capabilities: {e}")
+            return
+
+        if key is not None:
+            with _CAPABILITIES_LOCK:
+                _JSON_OUTPUT_SUPPORT[key] = self._supports_json_output
 
     def _get_version(self) -> str:
         """Get the SQLmap version.
@@ -100,7 +349,9 @@ class SQLMapIntegration(ToolIntegration):
         if not target_url:
             raise IntegrationError("Target URL is required for SQLmap scan")
 
-        cmd_builder = CommandBuilder([self.binary_name if self.binary_path else "sqlmap"])
+        cmd_builder = self._command_builder(
+            self.binary_name if self.binary_path else "sqlmap"
+        )
 
         # Add target URL
         cmd_builder.add_flag("-u", target_url)
@@ -108,62 +359,37 @@ class SQLMapIntegration(ToolIntegration):
         # Add batch mode for non-interactive execution
         cmd_builder.add_flag("--batch")
         
-        # Create a temporary directory for output if not specified
-        output_dir = options.get("output_dir")
-        if not output_dir:
-            # Create directory in user's home folder to ensure write permissions
-            output_dir = os.path.join(os.path.expanduser("~"), ".penkit", "sqlmap_output")
-            os.makedirs(output_dir, exist_ok=True)
+        # Use the default output directory if not specified
+        output_dir = options.get("output_dir") or _default_output_dir()
         
         # Add output directory flag
         cmd_builder.add_flag("--output-dir", output_dir)
         
-        # Only add JSON output flag if supported
+        # Only add JSON output flag if supported. Each scan gets its own
+        # results file, so concurrent scans sharing an output directory never
+        # read back each other's findings.
+        results_json: Optional[str] = None
         if self._supports_json_output:
-            results_json = os.path.join(output_dir, "results.json")
+            results_json = os.path.join(
+                output_dir, f"results-{uuid.uuid4().hex}.json"
+            )
             cmd_builder.add_flag("--json-output", results_json)
         
-        # Add POST data if provided
-        if "data" in options and options["data"]:
-            cmd_builder.add_flag("--data", options["data"])
-            
-        # Add cookie if provided
-        if "cookie" in options and options["cookie"]:
-            cmd_builder.add_flag("--cookie", options["cookie"])
-            
+        # Add value options (POST data, cookie, user agent, level, risk, DBMS,
+        # crawl depth, threads) when they are set
+        for key, flag in _VALUE_OPTION_FLAGS:
+            if value := options.get(key):
+                cmd_builder.add_flag(flag, value)
+
         # Add custom headers if provided
-        if "headers" in options and options["headers"]:
-            for header, value in options["headers"].items():
+        if headers := options.get("headers"):
+            for header, value in headers.items():
                 cmd_builder.add_flag("-H", f"{header}: {value}")
-                
-        # Add user agent if provided
-        if "user_agent" in options and options["user_agent"]:
-            cmd_builder.add_flag("--user-agent", options["user_agent"])
-            
-        # Add detection level if provided
-        if "level" in options and options["level"]:
-            cmd_builder.add_flag("--level", options["level"])
-            
-        # Add risk level if provided
-        if "risk" in options and options["risk"]:
-            cmd_builder.add_flag("--risk", options["risk"])
-            
-        # Add target DBMS if provided
-        if "dbms" in options and options["dbms"]:
-            cmd_builder.add_flag("--dbms", options["dbms"])
-            
+
         # Add form testing if enabled
         if options.get("forms", False):
             cmd_builder.add_flag("--forms")
-            
-        # Add crawling if enabled
-        if "crawl" in options and options["crawl"]:
-            cmd_builder.add_flag("--crawl", options["crawl"])
-            
-        # Add threading if specified
-        if "threads" in options and options["threads"]:
-            cmd_builder.add_flag("--threads", options["threads"])
-        
+
         # Add additional arguments
         for arg in args:
             cmd_builder.add_arg(arg)
@@ -174,9 +400,34 @@ class SQLMapIntegration(ToolIntegration):
         # Log the full command for debugging
         logger.debug(f"Running SQLMap command: {cmd_builder.build()}")
 
-        # Run the scan
-        result = self.run(*cmd_builder.build()[1:], timeout=timeout)
+        # Run the scan, streaming stdout to a file that is parsed line by line
+        result = self.run(*cmd_builder.build()[1:], timeout=timeout, stream=True)
+        try:
+            return self._scan_result(result, results_json, timeout)
+        finally:
+            if result.stdout_path:
+                os.unlink(result.stdout_path)
+            if results_json:
+                Path(results_json).unlink(missing_ok=True)
+
+    def _scan_result(
+        self, result: ToolResult, results_json: Optional[str], timeout: int
+    ) -> Dict[str, Any]:
+        """Turn a finished SQLmap run into scan results.
+
+        Args:
+            result: Result of the SQLmap run
+            results_json: File SQLmap was asked to write JSON results to, or
+                None if it does not support JSON output
+            timeout: Timeout the scan was run with
+
+        Returns:
+            Scan results
 
+        Raises:
+            IntegrationError: If the scan failed or timed out
+            OutputParsingError: If the output could not be parsed
+        """
         # Check for errors
         if result.status == "error":
             raise IntegrationError(f"SQLmap scan failed: {result.stderr}")
@@ -187,30 +438,38 @@ class SQLMapIntegration(ToolIntegration):
         if result.status == "parse_error":
             raise OutputParsingError("Failed to parse SQLmap output")
 
-        # Try to read JSON results if available
-        if self._supports_json_output:
-            results_json = os.path.join(output_dir, "results.json")
-            if os.path.exists(results_json):
-                try:
-                    with open(results_json, 'r') as f:
-                        json_data = json.load(f)
-                        parsed_result = self._process_json_output(json_data)
-                        return parsed_result
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Error reading JSON results: {e}")
+        # Try to read JSON results if available; sqlmap has exited, so the
+        # file is complete if it exists and is opened without a stat first
+        if results_json:
+            try:
+                json_data = _load_json_file(results_json)
+                if _scan_data(json_data) is not None:
+                    return self._process_json_output(json_data)
+                logger.warning(f"Unexpected JSON results in {results_json}")
+            except FileNotFoundError:
+                logger.debug(f"No JSON results written to {results_json}")
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Error reading JSON results: {e}")
         
         # Fall back to parsed output from stdout
         if result.parsed_result:
             return result.parsed_result
         
         # If all else fails, parse stdout directly
-        return self._parse_text_output(result.stdout or "")
-
-    def parse_output(self, stdout: str, stderr: str) -> Dict[str, Any]:
+        if result.stdout_path:
+            return self.parse_output_from_file(
+                result.stdout_path, result.stderr or ""
+            )
+        stdout = result.stdout or ""
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", errors="replace")
+        return self._parse_text_output(stdout)
+
+    def parse_output(self, stdout: Union[str, bytes], stderr: str) -> Dict[str, Any]:
         """Parse SQLmap output.
 
         Args:
-            stdout: Standard output from SQLmap
+            stdout: Standard output from SQLmap, decoded here if given as bytes
             stderr: Standard error from SQLmap
 
         Returns:
@@ -222,22 +481,20 @@ class SQLMapIntegration(ToolIntegration):
         if not stdout and not stderr:
             raise OutputParsingError("No output from SQLmap")
 
-        result = {
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", errors="replace")
+
+        result: Dict[str, Any] = {
             "vulnerabilities": [],
             "summary": {},
             "raw_output": stdout,
         }
 
         # Try to find JSON in the output
-        json_match = re.search(r'({.*"data".*})', stdout, re.DOTALL)
-        if json_match:
-            try:
-                json_data = json.loads(json_match.group(1))
-                processed = self._process_json_output(json_data)
-                result.update(processed)
-                return result
-            except json.JSONDecodeError:
-                pass  # Fall back to text parsing
+        json_data = _locate_json(stdout)
+        if json_data is not None:
+            result.update(self._process_json_output(json_data))
+            return result
 
         # Try to parse stdout as text
         parsed_result = self._parse_text_output(stdout)
@@ -245,9 +502,44 @@ class SQLMapIntegration(ToolIntegration):
         
         return result
 
-    def _process_json_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def parse_output_from_file(self, path: str, stderr: str) -> Dict[str, Any]:
+        """Parse SQLmap output that was streamed to a file.
+
+        The file is scanned a line at a time, so memory use does not grow
+        with the length of the scan log. Structured results come from the
+        ``--json-output`` file, so embedded JSON is not looked for. Only the
+        last RAW_OUTPUT_TAIL_LINES lines are kept as the raw output, which is
+        the whole output for all but very long scans.
+
+        Args:
+            path: Path to the file holding SQLmap standard output
+            stderr: Standard error from SQLmap
+
+        Returns:
+            Parsed output as a dictionary
+
+        Raises:
+            OutputParsingError: If parsing fails
+        """
+        if not os.path.getsize(path) and not stderr:
+            raise OutputParsingError("No output from SQLmap")
+
+        parser = _TextOutputParser()
+        tail: Deque[str] = deque(maxlen=RAW_OUTPUT_TAIL_LINES)
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                parser.feed(line)
+                tail.append(line)
+
+        result: Dict[str, Any] = {"raw_output": "".join(tail)}
+        result.update(parser.result())
+        return result
+
+    def _process_json_output(self, data: Any) -> Dict[str, Any]:
         """Process JSON output from SQLmap.
 
+        Values that do not have the expected shape are skipped.
+
         Args:
             data: JSON data from SQLmap
 
@@ -259,25 +551,32 @@ class SQLMapIntegration(ToolIntegration):
             "summary": {},
         }
         
+        scan_data = _scan_data(data)
+        if scan_data is None:
+            return result
+
         # Extract vulnerabilities
-        if "data" in data and "vulnerable" in data["data"]:
-            for target_url, vulnerabilities in data["data"]["vulnerable"].items():
-                for vuln_type, details in vulnerabilities.items():
-                    # Create vulnerability object
-                    vulnerability = {
-                        "title": f"SQL Injection ({vuln_type})",
-                        "description": f"SQL Injection vulnerability found in {target_url}",
-                        "severity": Severity.HIGH,  # SQL injection is typically high severity
-                        "url": target_url,
-                        "type": vuln_type,
-                        "details": details,
-                    }
-                    result["vulnerabilities"].append(vulnerability)
-        
+        vulnerable = scan_data.get("vulnerable")
+        if isinstance(vulnerable, dict):
+            result["vulnerabilities"] = [
+                {
+                    "title": f"SQL Injection ({vuln_type})",
+                    "description": f"SQL Injection vulnerability found in {target_url}",
+                    "severity": _SEV_HIGH,
+                    "url": target_url,
+                    "type": vuln_type,
+                    "details": details,
+                }
+                for target_url, vulnerabilities in vulnerable.items()
+                if isinstance(vulnerabilities, dict)
+                for vuln_type, details in vulnerabilities.items()
+            ]
+
         # Extract summary
-        if "data" in data and "stats" in data["data"]:
-            result["summary"] = data["data"]["stats"]
-            
+        stats = scan_data.get("stats")
+        if isinstance(stats, dict):
+            result["summary"] = stats
+
         return result
 
     def _parse_text_output(self, output: str) -> Dict[str, Any]:
@@ -289,53 +588,13 @@ class SQLMapIntegration(ToolIntegration):
         Returns:
             Parsed data as a dictionary
         """
-        result = {
-            "vulnerabilities": [],
-            "summary": {
-                "scan_time": "",
-                "vulnerabilities_found": 0,
-                "scan_completed": False,
-            },
-        }
-        
         # Log the first part of output for debugging
         if output:
             logger.debug(f"Parsing SQLMap output: {output[:200]}...")
-        
-        # Extract target URL
-        target_url = None
-        url_pattern = re.compile(r"URL: (https?://\S+)")
-        url_match = url_pattern.search(output)
-        if url_match:
-            target_url = url_match.group(1)
-            logger.debug(f"Found target URL: {target_url}")
-        
-        # Check for vulnerabilities
-        vuln_pattern = re.compile(r"(?:parameter|Parameter|GET parameter|POST parameter) '([^']+)'.+(?:is vulnerable to|vulnerable to) '?([^']+)'?")
-        for match in vuln_pattern.finditer(output):
-            param, vuln_type = match.groups()
-            
-            vulnerability = {
-                "title": f"SQL Injection ({vuln_type})",
-                "description": f"SQL Injection vulnerability found in parameter '{param}'",
-                "severity": Severity.HIGH,
-                "url": target_url if target_url else "Unknown",
-                "parameter": param,
-                "type": vuln_type,
-            }
-            result["vulnerabilities"].append(vulnerability)
-        
-        # Extract scan time
-        time_pattern = re.compile(r"scan spent ([0-9:]+)")
-        time_match = time_pattern.search(output)
-        if time_match:
-            result["summary"]["scan_time"] = time_match.group(1)
-        
-        # Update summary
-        result["summary"]["vulnerabilities_found"] = len(result["vulnerabilities"])
-        result["summary"]["scan_completed"] = "scan completed" in output.lower()
-        
-        return result
+
+        parser = _TextOutputParser()
+        parser.feed(output)
+        return parser.result()
 
     def quick_scan(self, target_url: str) -> Dict[str, Any]:
         """Perform a quick scan of the target URL.
@@ -380,10 +639,9 @@ class SQLMapIntegration(ToolIntegration):
         Returns:
             Dictionary with vulnerability counts by type
         """
-        summary = {}
-        
-        for vuln in scan_result.get("vulnerabilities", []):
-            vuln_type = vuln.get("type", "unknown")
-            summary[vuln_type] = summary.get(vuln_type, 0) + 1
-            
-        return summary
\ No newline at end of file
+        return dict(
+            Counter(
+                vuln.get("type", "unknown")
+                for vuln in scan_result.get("vulnerabilities", ())
+            )
+        )
\ No newline at end of file
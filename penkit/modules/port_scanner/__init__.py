@@ -1,9 +1,21 @@
 """Port scanner module for PenKit."""
 
+from typing import Dict, Tuple
+
 from penkit.core.exceptions import ModuleError
 from penkit.core.plugin import PenKitPlugin
 from penkit.integrations.nmap_integration import NmapIntegration
 
+# Nmap arguments for each supported scan type
+_SCAN_TYPE_ARGS: Dict[str, Tuple[str, ...]] = {
+    "tcp": ("-sT",),
+    "syn": ("-sS",),
+    "udp": ("-sU",),
+}
+
+# Port fields kept in minimal output
+_MINIMAL_PORT_KEYS = ("port", "service", "protocol", "version", "banner")
+
 
 class PortScannerPlugin(PenKitPlugin):
     """Port scanner plugin for PenKit."""
@@ -53,7 +65,7 @@ class PortScannerPlugin(PenKitPlugin):
             raise ModuleError("Target must be specified")
 
         ports = self.options.get("ports")
-        scan_type = self.options.get("scan_type")
+        scan_type = str(self.options.get("scan_type", ""))
         timing = self.options.get("timing")
         service_detection = self.options.get("service_detection")
         script_scan = self.options.get("script_scan")  # Get script scan option
@@ -70,14 +82,7 @@ class PortScannerPlugin(PenKitPlugin):
         }
 
         # Add scan type flags
-        if scan_type == "tcp":
-            scan_args = ["-sT"]
-        elif scan_type == "syn":
-            scan_args = ["-sS"]
-        elif scan_type == "udp":
-            scan_args = ["-sU"]
-        else:
-            scan_args = []
+        scan_args = list(_SCAN_TYPE_ARGS.get(scan_type, ()))
             
         # Add show only open flag if enabled
         if show_only_open:
@@ -105,28 +110,19 @@ class PortScannerPlugin(PenKitPlugin):
         Returns:
             Formatted results
         """
-        minimal = {"target": self.options.get("target"), "hosts": []}
-
         # Extract host and open port information
-        for host in results.get("hosts", []):
-            host_info = {
-                "ip": host.get("ip_address"),
-                "hostname": host.get("hostname"),
-                "open_ports": [],
-            }
-
-            for port in host.get("open_ports", []):
-                if port.get("state") == "open":
-                    host_info["open_ports"].append(
-                        {
-                            "port": port.get("port"),
-                            "service": port.get("service"),
-                            "protocol": port.get("protocol"),
-                            "version": port.get("version"),
-                            "banner": port.get("banner"),
-                        }
-                    )
-
-            minimal["hosts"].append(host_info)
-
-        return minimal
\ No newline at end of file
+        return {
+            "target": self.options.get("target"),
+            "hosts": [
+                {
+                    "ip": host.get("ip_address"),
+                    "hostname": host.get("hostname"),
+                    "open_ports": [
+                        {key: port.get(key) for key in _MINIMAL_PORT_KEYS}
+                        for port in host.get("open_ports", ())
+                        if port.get("state") == "open"
+                    ],
+                }
+                for host in results.get("hosts", ())
+            ],
+        }
@@ -1,15 +1,94 @@
 """Web vulnerability scanner module for PenKit."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from penkit.core.exceptions import ModuleError
 from penkit.core.plugin import PenKitPlugin
-from penkit.integrations.sqlmap_integration import SQLMapIntegration
+
+if TYPE_CHECKING:
+    from penkit.integrations.sqlmap_integration import SQLMapIntegration
+
+# Module options passed through to SQLmap when set, with their scan option name
+_PASSTHROUGH_OPTIONS = (
+    ("data", "data"),
+    ("cookie", "cookie"),
+    ("user_agent", "user_agent"),
+    ("scan_level", "level"),
+    ("risk_level", "risk"),
+    ("forms", "forms"),
+    ("timeout", "timeout"),
+)
+
+# Module options that scan options are built from
+_SCAN_OPTION_KEYS = tuple(option for option, _ in _PASSTHROUGH_OPTIONS) + (
+    "crawl_depth",
+    "threads",
+)
+
+# Options stored as integers
+_INT_OPTIONS = frozenset(
+    ("scan_level", "risk_level", "crawl_depth", "threads", "timeout")
+)
+
+# Formatted results kept per plugin when cache_results is enabled, and how
+# long they stay valid in seconds
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_TTL = 3600
+
+# (expiry time, formatted results)
+_CacheEntry = Tuple[float, Dict[str, Any]]
+
+
+def _int_option(value: Any) -> int:
+    """Read an integer option, treating unset or invalid values as 0.
+
+    Args:
+        value: Option value
+
+    Returns:
+        Option value as an integer
+    """
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _get_sqlmap_integration() -> "SQLMapIntegration":
+    """Get the SQLmap integration shared by all web scanner instances.
+
+    The integration module is imported here rather than at the top of this
+    module, so importing the web scanner alone does not load it. Registering
+    the plugin does, since the integration is created in ``__init__``.
+
+    Returns:
+        SQLmap integration, probed for its binary only once per process
+    """
+    from penkit.integrations.sqlmap_integration import SQLMapIntegration
+
+    return SQLMapIntegration()
 
 
 class WebScannerPlugin(PenKitPlugin):
     """Web vulnerability scanner plugin for PenKit."""
 
+    __slots__ = (
+        "sqlmap",
+        "_last_opts_key",
+        "_last_scan_options",
+        "_result_cache",
+        "_result_cache_lock",
+    )
+
     name = "web_scanner"
     description = "Scan web applications for vulnerabilities"
     version = "0.1.0"
@@ -23,17 +102,26 @@ class WebScannerPlugin(PenKitPlugin):
             "data": "",  # POST data
             "cookie": "",
             "user_agent": "PenKit Web Scanner",
-            "scan_level": "1",  # 1-5
-            "risk_level": "1",  # 1-3
+            "scan_level": 1,  # 1-5
+            "risk_level": 1,  # 1-3
             "forms": True,  # Scan forms
-            "crawl_depth": "0",  # 0 = disabled
-            "threads": "1",
+            "crawl_depth": 0,  # 0 = disabled
+            "threads": 1,
             "timeout": 1800,  # 30 minutes
             "scan_type": "quick",  # quick, thorough
+            "cache_results": False,  # Reuse results of identical scans
         }
 
-        # Initialize SQLmap integration
-        self.sqlmap = SQLMapIntegration()
+        # Reuse the shared SQLmap integration
+        self.sqlmap = _get_sqlmap_integration()
+
+        # Scan options built for the last snapshot of the module options
+        self._last_opts_key: Optional[Tuple[Any, ...]] = None
+        self._last_scan_options: Dict[str, Any] = {}
+
+        # (URL, scan options, scan type) -> (expiry time, formatted results)
+        self._result_cache: "OrderedDict[Tuple[Any, ...], _CacheEntry]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
     def setup(self) -> None:
         """Set up the plugin."""
@@ -43,11 +131,36 @@ class WebScannerPlugin(PenKitPlugin):
                 "Warning: SQLmap is not available. Web scanning functionality will be limited."
             )
 
-    def run(self) -> Dict[str, Any]:
+    def set_option(self, option: str, value: Any) -> bool:
+        """Set a plugin option.
+
+        Integer options are parsed here once rather than on every run.
+
+        Args:
+            option: Option name
+            value: Option value
+
+        Returns:
+            True if successful, False otherwise, including when an integer
+            option is given a value that is not an integer
+        """
+        if option in _INT_OPTIONS:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                return False
+        self._last_opts_key = None
+        return super().set_option(option, value)
+
+    def run(self) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Run the web vulnerability scanner.
 
+        The target_url option may be a single URL or a list of URLs. A list is
+        scanned concurrently, one SQLmap process per URL.
+
         Returns:
-            Scan results
+            Scan results, or a list of scan results in URL order when
+            target_url is a list
 
         Raises:
             ModuleError: If the scan fails
@@ -56,68 +169,163 @@ class WebScannerPlugin(PenKitPlugin):
         if not target_url:
             raise ModuleError("Target URL must be specified")
 
-        # Build scan options from module options
+        if isinstance(target_url, str):
+            return self._scan_one(target_url, self._build_scan_options())
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> List[Dict[str, Any]]:
+        """Run the web vulnerability scanner against every target URL at once.
+
+        SQLmap scans spend most of their time waiting on the target, so each
+        URL is scanned in its own worker thread and the scans overlap.
+
+        Returns:
+            List of scan results in URL order
+
+        Raises:
+            ModuleError: If any scan fails
+        """
+        target_url = self.options.get("target_url")
+        if not target_url:
+            raise ModuleError("Target URL must be specified")
+
+        urls = [target_url] if isinstance(target_url, str) else list(target_url)
+        scan_options = self._build_scan_options()
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(self._scan_one, url, scan_options) for url in urls)
+            )
+        )
+
+    def _build_scan_options(self) -> Dict[str, Any]:
+        """Build SQLmap scan options from the module options.
+
+        The result is reused until one of the options it is built from changes.
+
+        Returns:
+            Scan options with empty values removed
+        """
+        key = tuple(map(self.options.get, _SCAN_OPTION_KEYS))
+        if key == self._last_opts_key:
+            return self._last_scan_options
+
+        # Only set options are added, so there is nothing to filter out after
+        *passthrough, crawl_depth, threads = key
         scan_options = {
-            "data": self.options.get("data"),
-            "cookie": self.options.get("cookie"),
-            "user_agent": self.options.get("user_agent"),
-            "level": self.options.get("scan_level"),
-            "risk": self.options.get("risk_level"),
-            "forms": self.options.get("forms"),
-            "timeout": self.options.get("timeout"),
+            name: value
+            for (_, name), value in zip(_PASSTHROUGH_OPTIONS, passthrough)
+            if value
         }
 
-        # Add crawl depth if enabled
-        crawl_depth = self.options.get("crawl_depth")
-        if crawl_depth and int(crawl_depth) > 0:
+        # Add crawl depth if enabled; options assigned directly rather than
+        # through set_option may still hold strings or None
+        crawl_depth = _int_option(crawl_depth)
+        if crawl_depth > 0:
             scan_options["crawl"] = crawl_depth
 
         # Add threading if more than 1
-        threads = self.options.get("threads")
-        if threads and int(threads) > 1:
+        threads = _int_option(threads)
+        if threads > 1:
             scan_options["threads"] = threads
 
-        # Remove empty options
-        scan_options = {k: v for k, v in scan_options.items() if v}
+        self._last_scan_options = scan_options
+        self._last_opts_key = key
+        return self._last_scan_options
+
+    def _scan_one(
+        self, target_url: str, scan_options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Scan a single URL.
+
+        With cache_results enabled, a repeated scan with the same options and
+        SQLmap setup is served from the result cache for RESULT_CACHE_TTL
+        seconds; such results are marked with ``"cached": True``.
+
+        Args:
+            target_url: URL to scan
+            scan_options: Scan options from _build_scan_options
+
+        Returns:
+            Formatted scan results
+
+        Raises:
+            ModuleError: If the scan fails
+        """
+        scan_type = self.options.get("scan_type", "quick")
+        use_cache = bool(self.options.get("cache_results"))
+        key = (
+            target_url,
+            scan_type,
+            tuple(map(self.options.get, _SCAN_OPTION_KEYS)),
+            self.sqlmap.binary_path,
+            self.sqlmap.use_container,
+        )
+
+        if use_cache:
+            now = time.monotonic()
+            with self._result_cache_lock:
+                entry = self._result_cache.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        self._result_cache.move_to_end(key)
+                    else:
+                        del self._result_cache[key]
+                        entry = None
+            if entry is not None:
+                cached = copy.deepcopy(entry[1])
+                cached["cached"] = True
+                return cached
 
         # Run the scan based on scan type
         try:
-            scan_type = self.options.get("scan_type", "quick")
-            
             if scan_type == "thorough":
                 results = self.sqlmap.thorough_scan(target_url, **scan_options)
             else:  # Default to quick scan
                 results = self.sqlmap.quick_scan(target_url)
                 
-            return self._format_results(results)
+            formatted = self._format_results(results, target_url)
         except Exception as e:
             raise ModuleError(f"Web vulnerability scan failed: {str(e)}")
 
-    def _format_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        if not use_cache:
+            return formatted
+
+        with self._result_cache_lock:
+            self._result_cache[key] = (
+                time.monotonic() + RESULT_CACHE_TTL,
+                copy.deepcopy(formatted),
+            )
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+        return formatted
+
+    def _format_results(
+        self, results: Dict[str, Any], target_url: str
+    ) -> Dict[str, Any]:
         """Format scan results.
 
         Args:
             results: Raw scan results
+            target_url: URL the results are for
 
         Returns:
             Formatted results
         """
         formatted = {
-            "target_url": self.options.get("target_url"),
+            "target_url": target_url,
             "scan_type": self.options.get("scan_type"),
             "vulnerabilities": results.get("vulnerabilities", []),
             "summary": results.get("summary", {}),
         }
         
-        # Add vulnerability count
+        # Add vulnerability count and types summary
         formatted["vulnerability_count"] = len(formatted["vulnerabilities"])
-        
-        # Add vulnerability types summary
-        vuln_types = {}
-        for vuln in formatted["vulnerabilities"]:
-            vuln_type = vuln.get("type", "unknown")
-            vuln_types[vuln_type] = vuln_types.get(vuln_type, 0) + 1
-            
-        formatted["vulnerability_types"] = vuln_types
+        formatted["vulnerability_types"] = dict(
+            Counter(
+                vuln.get("type", "unknown") for vuln in formatted["vulnerabilities"]
+            )
+        )
         
         return formatted
@@ -1,8 +1,16 @@
 """JSON utilities for PenKit."""
 
+import io
 import json
 import datetime
-from typing import Any
+from typing import IO, Any
+
+# orjson encodes in C with native datetime support; fall back to the stdlib
+# encoder when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 class PenKitJSONEncoder(json.JSONEncoder):
@@ -17,8 +25,63 @@ class PenKitJSONEncoder(json.JSONEncoder):
         Returns:
             JSON-serializable representation
         """
-        if isinstance(obj, datetime.datetime):
-            return obj.isoformat()
-        elif isinstance(obj, datetime.date):
+        # datetime.datetime is a subclass of datetime.date
+        if isinstance(obj, datetime.date):
             return obj.isoformat()
         return super().default(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to JSON, handling datetime objects.
+
+    orjson is used when installed. Objects it cannot encode, such as
+    dictionaries with non-string keys, go through PenKitJSONEncoder instead.
+
+    Args:
+        obj: Object to encode
+        indent: Indent the output by two spaces
+
+    Returns:
+        JSON string
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 if indent else None
+            ).decode()
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(obj, indent=2 if indent else None, cls=PenKitJSONEncoder)
+
+
+def dump(obj: Any, fp: IO[bytes], indent: bool = False) -> None:
+    """Serialize an object as UTF-8 JSON to a binary file, handling datetimes.
+
+    orjson's encoded bytes are written as they are, without decoding them to
+    a string first. Without orjson, or for objects it cannot encode, the
+    stdlib encoder streams the document to the file in chunks.
+
+    Args:
+        obj: Object to encode
+        fp: Binary file to write to
+        indent: Indent the output by two spaces
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        try:
+            fp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None))
+            return
+        except TypeError:
+            pass
+    text = io.TextIOWrapper(fp, encoding="utf-8", write_through=True)
+    try:
+        json.dump(obj, text, indent=2 if indent else None, cls=PenKitJSONEncoder)
+    finally:
+        # Leave the caller's file open
+        text.detach()
@@ -0,0 +1,402 @@
+"""Test base tool integration functionality."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from penkit.integrations import base
+from penkit.integrations.base import (
+    CommandBuilder,
+    DockerToolIntegration,
+    OutputHelper,
+    ToolIntegration,
+    warmup_versions,
+)
+
+# Resolved before tests replace PATH
+SLEEP_BINARY = shutil.which("sleep")
+
+
+class SampleIntegration(ToolIntegration):
+    """Minimal integration used for testing."""
+
+    name = "sample_tool"
+    description = "Sample tool for unit tests"
+    binary_name = "penkit-sample-tool"
+
+    def parse_output(self, stdout: str, stderr: str) -> Dict[str, Any]:
+        """Return the raw output.
+
+        Args:
+            stdout: Standard output from the tool
+            stderr: Standard error from the tool
+
+        Returns:
+            Parsed output as a dictionary
+        """
+        return {"stdout": stdout}
+
+
+@pytest.fixture
+def sample_binary(tmp_path, monkeypatch):
+    """Create an executable sample binary on an isolated PATH."""
+    binary = tmp_path / SampleIntegration.binary_name
+    binary.write_text("#!/bin/sh\necho sample 1.0\n")
+    binary.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    monkeypatch.setattr(base, "_BINARY_CACHE", {})
+    return str(binary)
+
+
+def test_find_binary_is_cached(sample_binary) -> None:
+    """Test that PATH lookups are shared across instances."""
+    with patch(
+        "penkit.integrations.base.shutil.which", return_value=sample_binary
+    ) as which:
+        first = SampleIntegration()
+        second = SampleIntegration()
+
+    assert first.binary_path == sample_binary
+    assert second.binary_path == sample_binary
+    which.assert_called_once_with(SampleIntegration.binary_name)
+
+
+def test_version_is_resolved_lazily(sample_binary) -> None:
+    """Test that the version probe only runs when the version is read."""
+    with patch.object(
+        SampleIntegration, "_get_version", return_value="1.0"
+    ) as mock_get_version:
+        integration = SampleIntegration()
+        mock_get_version.assert_not_called()
+
+        assert integration.version == "1.0"
+        assert integration.version == "1.0"
+
+    mock_get_version.assert_called_once()
+
+
+def test_missing_binary_is_negative_cached(tmp_path, monkeypatch) -> None:
+    """Test that a missing binary is not searched for again."""
+    monkeypatch.setenv("PATH", str(tmp_path))
+    monkeypatch.setattr(base, "_BINARY_CACHE", {})
+
+    with patch("penkit.integrations.base.shutil.which", return_value=None) as which:
+        first = SampleIntegration()
+        second = SampleIntegration()
+
+    assert first.binary_path is None
+    assert second.binary_path is None
+    which.assert_called_once_with(SampleIntegration.binary_name)
+
+
+def test_version_probe_is_shared(sample_binary, monkeypatch) -> None:
+    """Test that instances of the same tool share one version probe."""
+    monkeypatch.setattr(base, "_VERSION_CACHE", {})
+
+    with patch("penkit.integrations.base.subprocess.run") as mock_run:
+        mock_run.return_value.stdout = "sample 1.0\n"
+        first = SampleIntegration()
+        second = SampleIntegration()
+
+        assert first.version == "sample 1.0"
+        assert second.version == "sample 1.0"
+
+    mock_run.assert_called_once()
+
+
+class SampleDockerIntegration(DockerToolIntegration, SampleIntegration):
+    """Docker-based integration used for testing."""
+
+    container_image = "penkit/sample:latest"
+
+
+class FakeDocker:
+    """Stand-in for subprocess.run that records docker invocations."""
+
+    def __init__(self, running: bool = True, start_error: Any = None) -> None:
+        """Initialize the fake.
+
+        Args:
+            running: Whether started containers report as running
+            start_error: Exception raised when a container is started
+        """
+        self.calls: list = []
+        self.running = running
+        self.start_error = start_error
+        self.started = 0
+
+    def __call__(self, cmd: list, **kwargs: Any) -> Any:
+        """Record a command and return a canned result.
+
+        Args:
+            cmd: Command that would have been run
+            **kwargs: subprocess.run keyword arguments
+
+        Returns:
+            Result with returncode and stdout
+        """
+        self.calls.append(cmd)
+        result = MagicMock(returncode=0, stdout="")
+        if cmd[:2] == ["docker", "run"]:
+            if self.start_error:
+                raise self.start_error
+            self.started += 1
+            result.stdout = f"c{self.started}\n"
+        elif cmd[:3] == ["docker", "container", "inspect"]:
+            result.stdout = "true\n" if self.running else "false\n"
+        return result
+
+
+@pytest.fixture
+def docker_integration(monkeypatch):
+    """Create a Docker-based integration with no local binary."""
+    monkeypatch.setattr(base, "_docker_version", lambda: "Docker version 24.0")
+    monkeypatch.setattr(base, "_CONTAINERS", {})
+    monkeypatch.setattr(base, "_CONTAINER_START_LOCKS", {})
+    integration = SampleDockerIntegration()
+    integration.binary_path = None
+    return integration
+
+
+def test_docker_container_is_reused(docker_integration) -> None:
+    """Test that container commands reuse one long-lived container."""
+    docker = FakeDocker()
+    with patch("penkit.integrations.base.subprocess.run", side_effect=docker):
+        first = docker_integration.build_command("-v")
+        second = docker_integration.build_command("-h")
+
+        assert docker.started == 1
+        assert first == ["docker", "exec", "c1", "penkit-sample-tool", "-v"]
+        assert second[-1] == "-h"
+
+        docker_integration.close()
+
+    assert docker.calls[-1] == ["docker", "rm", "-f", "c1"]
+    assert base._CONTAINERS == {}
+
+
+def test_docker_stopped_container_is_replaced(docker_integration) -> None:
+    """Test that a container that has stopped is started again."""
+    docker = FakeDocker(running=False)
+    with patch("penkit.integrations.base.subprocess.run", side_effect=docker):
+        docker_integration.build_command("-v")
+        command = docker_integration.build_command("-v")
+
+    assert docker.started == 2
+    assert command[:3] == ["docker", "exec", "c2"]
+
+
+def test_docker_image_without_sleep_runs_per_command(docker_integration) -> None:
+    """Test falling back to docker run --rm when a container cannot idle."""
+    docker = FakeDocker(
+        start_error=subprocess.CalledProcessError(127, "docker", stderr="no sleep")
+    )
+    with patch("penkit.integrations.base.subprocess.run", side_effect=docker):
+        first = docker_integration.build_command("-v")
+        second = docker_integration.build_command("-v")
+
+    expected = ["docker", "run", "--rm", "penkit/sample:latest", "-v"]
+    assert first == second == expected
+    # The failed start is remembered rather than retried for every command
+    assert len(docker.calls) == 1
+
+
+def test_docker_prefers_local_binary(sample_binary, monkeypatch) -> None:
+    """Test that an installed binary is used before the container."""
+    monkeypatch.setattr(base, "_docker_version", lambda: "Docker version 24.0")
+    monkeypatch.setattr(base, "_CONTAINERS", {})
+
+    with patch("penkit.integrations.base.subprocess.run") as mock_run:
+        integration = SampleDockerIntegration()
+        command = integration.build_command("-v")
+
+    assert command == [sample_binary, "-v"]
+    mock_run.assert_not_called()
+
+
+def test_run_streams_stdout_to_file(sample_binary) -> None:
+    """Test that streamed output is written to a file and parsed from it."""
+    result = SampleIntegration().run(stream=True)
+
+    try:
+        assert result.status == "success"
+        assert result.stdout is None
+        assert result.parsed_result == {"stdout": "sample 1.0\n"}
+        with open(result.stdout_path) as f:
+            assert f.read() == "sample 1.0\n"
+    finally:
+        os.unlink(result.stdout_path)
+
+
+def test_run_and_run_async_agree(sample_binary) -> None:
+    """Test that the blocking and asynchronous runners build the same result."""
+    integration = SampleIntegration()
+
+    sync_result = integration.run()
+    async_result = asyncio.run(integration.run_async())
+
+    for result in (sync_result, async_result):
+        assert result.status == "success"
+        assert result.exit_code == 0
+        assert result.stdout == "sample 1.0\n"
+        assert result.parsed_result == {"stdout": "sample 1.0\n"}
+        assert result.command == [sample_binary]
+        assert result.to_dict()["command"] == sample_binary
+
+
+def test_run_binary_stdout(sample_binary) -> None:
+    """Test that binary_stdout keeps output as bytes in both runners."""
+    integration = SampleIntegration()
+
+    sync_result = integration.run(binary_stdout=True)
+    async_result = asyncio.run(integration.run_async(binary_stdout=True))
+
+    for result in (sync_result, async_result):
+        assert result.stdout == b"sample 1.0\n"
+        assert result.parsed_result == {"stdout": b"sample 1.0\n"}
+        assert result.to_dict()["stdout"] == "sample 1.0\n"
+
+
+def test_run_timeout(sample_binary) -> None:
+    """Test that the blocking runner reports timeouts."""
+    with open(sample_binary, "w") as f:
+        f.write(f"#!/bin/sh\nexec {SLEEP_BINARY} 5\n")
+
+    result = SampleIntegration().run(timeout=0.1)
+
+    assert result.status == "timeout"
+    assert result.exit_code is None
+
+
+def test_submit_runs_in_background(sample_binary) -> None:
+    """Test that submitted runs complete on the shared background loop."""
+    integration = SampleIntegration()
+
+    futures = [integration.submit() for _ in range(3)]
+
+    for future in futures:
+        result = future.result(timeout=10)
+        assert result.status == "success"
+        assert result.stdout == "sample 1.0\n"
+
+
+def test_failed_run_is_not_parsed(sample_binary) -> None:
+    """Test that output of a failed run is only parsed on request."""
+    with open(sample_binary, "w") as f:
+        f.write("#!/bin/sh\necho partial\nexit 3\n")
+
+    integration = SampleIntegration()
+    failed = integration.run()
+    parsed = integration.run(parse_on_error=True)
+
+    assert failed.status == "error"
+    assert failed.exit_code == 3
+    assert failed.parsed_result is None
+    assert parsed.status == "error"
+    assert parsed.parsed_result == {"stdout": "partial\n"}
+
+
+def test_command_builder_bulk_extend() -> None:
+    """Test that bulk flag and argument helpers match the chained methods."""
+    chained = (
+        CommandBuilder("nmap")
+        .add_flag("-oX", "-")
+        .add_flag("-sV", True)
+        .add_flag("-O", False)
+        .add_flag("--open")
+        .add_flag("-T", 4)
+        .add_arg("10.0.0.1")
+    )
+    bulk = (
+        CommandBuilder("nmap")
+        .extend_flags({"-oX": "-", "-sV": True, "-O": False, "--open": None, "-T": 4})
+        .extend_args(["10.0.0.1"])
+    )
+
+    assert bulk.build() == chained.build()
+    assert bulk.build() == ["nmap", "-oX", "-", "-sV", "--open", "-T", "4", "10.0.0.1"]
+
+
+def test_command_builder_reset() -> None:
+    """Test that a reset builder only holds the new base command."""
+    builder = CommandBuilder(["sqlmap", "-v"]).add_flag("-u", "http://a/")
+    first = builder.build()
+
+    builder.reset("sqlmap").add_flag("--batch")
+
+    assert builder.build() == ["sqlmap", "--batch"]
+    assert first == ["sqlmap", "-v", "-u", "http://a/"]
+
+
+def test_output_helper_round_trip() -> None:
+    """Test saving content to a temporary file and reading it back."""
+    content = "café\n" * 1000
+
+    name, path = OutputHelper.save_to_file(content, prefix="penkit_test", suffix=".txt")
+    try:
+        assert name == os.path.basename(path)
+        assert os.path.getsize(path) == len(content.encode("utf-8"))
+        assert OutputHelper.read_file(path) == content
+    finally:
+        os.unlink(path)
+
+
+def test_output_helper_map_file(tmp_path) -> None:
+    """Test memory-mapping tool output files."""
+    output = tmp_path / "output.xml"
+    output.write_bytes(b"<nmaprun/>")
+    empty = tmp_path / "empty.xml"
+    empty.write_bytes(b"")
+
+    with OutputHelper.map_file(str(output)) as mapped:
+        assert mapped[:] == b"<nmaprun/>"
+
+    with OutputHelper.map_file(str(empty)) as mapped:
+        assert mapped == b""
+
+
+def test_build_command_follows_binary_changes(sample_binary) -> None:
+    """Test that the specialized command prefix tracks configuration changes."""
+    integration = SampleIntegration()
+    assert integration.build_command("-v") == [sample_binary, "-v"]
+
+    integration.binary_path = None
+    integration.use_container = True
+    integration.container_image = "penkit/sample:latest"
+    assert integration.build_command("-v") == [
+        "docker",
+        "run",
+        "--rm",
+        "penkit/sample:latest",
+        "-v",
+    ]
+
+
+def test_warmup_versions_fills_cache(sample_binary, monkeypatch) -> None:
+    """Test that warming up versions avoids later blocking probes."""
+    monkeypatch.setattr(base, "_VERSION_CACHE", {})
+    integrations = [SampleIntegration(), SampleIntegration()]
+
+    asyncio.run(warmup_versions(integrations))
+
+    with patch("penkit.integrations.base.subprocess.run") as mock_run:
+        assert [i.version for i in integrations] == ["sample 1.0", "sample 1.0"]
+
+    mock_run.assert_not_called()
+
+
+def test_configured_binary_path(sample_binary, tmp_path, monkeypatch) -> None:
+    """Test that a configured binary path is used only if it is executable."""
+    tools = {SampleIntegration.name: {"path": sample_binary}}
+    monkeypatch.setitem(base.config.config, "tools", tools)
+    assert SampleIntegration().binary_path == sample_binary
+
+    not_executable = tmp_path / "not-executable"
+    not_executable.write_text("")
+    tools[SampleIntegration.name]["path"] = str(not_executable)
+    assert SampleIntegration().binary_path is None
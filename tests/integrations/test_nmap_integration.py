@@ -0,0 +1,315 @@
+"""Test Nmap integration functionality."""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from penkit.core.exceptions import IntegrationError, OutputParsingError
+from penkit.core.models import Host, HostStatus, Port
+from penkit.integrations.nmap_integration import NmapIntegration
+
+SAMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE nmaprun>
+<nmaprun scanner="nmap" args="nmap -oX - -sV 10.0.0.0/30" start="1700000000" version="7.94" xmloutputversion="1.05">
+<scaninfo type="connect" protocol="tcp" numservices="1000" services="1-1000"/>
+<host starttime="1700000001" endtime="1700000010">
+<status state="up" reason="conn-refused" reason_ttl="0"/>
+<address addr="10.0.0.1" addrtype="ipv4"/>
+<address addr="00:11:22:33:44:55" addrtype="mac" vendor="Acme"/>
+<hostnames>
+<hostname name="gateway.local" type="PTR"/>
+<hostname name="gateway" type="user"/>
+</hostnames>
+<ports>
+<extraports state="closed" count="997"/>
+<port protocol="tcp" portid="22"><state state="open" reason="syn-ack" reason_ttl="0"/><service name="ssh" product="OpenSSH" version="8.9p1" method="probed" conf="10"/></port>
+<port protocol="tcp" portid="80"><state state="open" reason="syn-ack" reason_ttl="0"/><service name="http" product="nginx" method="probed" conf="10"/><script id="banner" output="HTTP/1.1 200 OK"/></port>
+<port protocol="tcp" portid="443"><state state="filtered" reason="no-response" reason_ttl="0"/></port>
+</ports>
+<os><osmatch name="" accuracy="90"/><osmatch name="Linux 5.X" accuracy="95"/></os>
+</host>
+<host starttime="1700000001" endtime="1700000010">
+<status state="down" reason="no-response" reason_ttl="0"/>
+<address addr="10.0.0.2" addrtype="ipv4"/>
+</host>
+<host>
+<status state="up" reason="user-set" reason_ttl="0"/>
+<address addr="fe80::1" addrtype="ipv6"/>
+</host>
+<runstats><finished time="1700000010" timestr="Tue Nov 14 22:13:30 2023" summary="Nmap done: 4 IP addresses (2 hosts up) scanned in 10.00 seconds" elapsed="10.00" exit="success"/><hosts up="2" down="2" total="4"/>
+</runstats>
+</nmaprun>
+"""
+
+
+@pytest.fixture
+def nmap_integration():
+    """Create an Nmap integration instance for testing."""
+    with patch.object(NmapIntegration, "__init__", return_value=None):
+        integration = NmapIntegration()
+        integration.binary_path = "/usr/bin/nmap"  # Mock binary path
+        integration.use_container = False
+        return integration
+
+
+def test_parse_output_hosts(nmap_integration):
+    """Test parsing hosts from Nmap XML output."""
+    result = nmap_integration.parse_output(SAMPLE_XML, "")
+
+    # The IPv6-only host has no IPv4 address and is skipped
+    assert [host["ip_address"] for host in result["hosts"]] == [
+        "10.0.0.1",
+        "10.0.0.2",
+    ]
+
+    gateway = result["hosts"][0]
+    assert gateway["status"] == "up"
+    assert gateway["hostname"] == "gateway"
+    assert gateway["mac_address"] == "00:11:22:33:44:55"
+    assert gateway["os"] == "Linux 5.X"
+    assert result["hosts"][1]["status"] == "down"
+
+
+def test_parse_output_ports(nmap_integration):
+    """Test parsing ports from Nmap XML output."""
+    result = nmap_integration.parse_output(SAMPLE_XML, "")
+    ports = result["hosts"][0]["open_ports"]
+
+    assert [port["port"] for port in ports] == [22, 80, 443]
+    assert ports[0]["protocol"] == "tcp"
+    assert ports[0]["service"] == "ssh"
+    assert ports[0]["version"] == "OpenSSH 8.9p1"
+    assert ports[1]["version"] == "nginx"
+    assert ports[1]["banner"] == "HTTP/1.1 200 OK"
+    assert ports[2]["state"] == "filtered"
+    assert ports[2]["service"] is None
+
+
+def test_parse_output_invalid_xml(nmap_integration):
+    """Test that malformed XML is reported as a parsing error."""
+    with pytest.raises(OutputParsingError):
+        nmap_integration.parse_output("<nmaprun><host>", "")
+
+
+def test_parse_output_empty(nmap_integration):
+    """Test parsing empty Nmap output."""
+    with pytest.raises(OutputParsingError) as exc_info:
+        nmap_integration.parse_output("", "nmap: command failed")
+
+    assert "nmap: command failed" in str(exc_info.value)
+
+
+def test_host_and_port_summary(nmap_integration):
+    """Test host and port summaries of scan results."""
+    result = nmap_integration.parse_output(SAMPLE_XML, "")
+
+    assert nmap_integration.get_host_summary(result) == (2, 1, 1)
+    assert nmap_integration.get_port_summary(result) == {22: 1, 80: 1, 443: 1}
+    assert nmap_integration.summarize(result) == (
+        (2, 1, 1),
+        {22: 1, 80: 1, 443: 1},
+    )
+
+
+def test_parse_output_from_file(nmap_integration, tmp_path):
+    """Test that streamed output files parse the same as in-memory output."""
+    xml_file = tmp_path / "scan.xml"
+    xml_file.write_text(SAMPLE_XML)
+
+    result = nmap_integration.parse_output_from_file(str(xml_file), "")
+
+    expected = nmap_integration.parse_output(SAMPLE_XML, "")
+    assert result["scan_info"] == expected["scan_info"]
+    assert [host["open_ports"] for host in result["hosts"]] == [
+        host["open_ports"] for host in expected["hosts"]
+    ]
+    assert result["scan_info"]["version"] == "7.94"
+    assert result["scan_info"]["exit"] == "success"
+
+
+def test_parse_output_serializable(nmap_integration):
+    """Test that parsed hosts carry ISO timestamps rather than datetimes."""
+    result = nmap_integration.parse_output(SAMPLE_XML, "")
+    host = result["hosts"][0]
+
+    assert isinstance(host["first_seen"], str)
+    assert datetime.fromisoformat(host["last_seen"])
+
+
+def test_parse_output_bytes(nmap_integration):
+    """Test that undecoded XML bytes parse like text."""
+    result = nmap_integration.parse_output(SAMPLE_XML.encode("utf-8"), "")
+
+    assert [host["ip_address"] for host in result["hosts"]] == [
+        "10.0.0.1",
+        "10.0.0.2",
+    ]
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ("Nmap version 7.94 ( https://nmap.org )\nPlatform: x86_64", "7.94"),
+        ("Nmap version 7.94SVN ( https://nmap.org )", "7.94"),
+        ("Starting Nmap\nNmap version 7.80 ( https://nmap.org )", "7.80"),
+        ("unexpected output", "unexpected output"),
+    ],
+)
+def test_get_version(nmap_integration, output, expected):
+    """Test extracting the version number from nmap --version output."""
+    with patch(
+        "penkit.integrations.base.ToolIntegration._get_version", return_value=output
+    ):
+        assert nmap_integration._get_version() == expected
+
+
+def test_scan_writes_output_xml_directly(nmap_integration, tmp_path):
+    """Test that output_xml is handed to nmap and parsed from disk."""
+    xml_file = tmp_path / "scan.xml"
+
+    def fake_run(*args, **kwargs):
+        xml_file.write_text(SAMPLE_XML)
+        return nmap_integration._build_result(
+            list(args),
+            datetime.now(),
+            0,
+            0,
+            "Nmap done",
+            "",
+            output_file=kwargs["output_file"],
+        )
+
+    nmap_integration.name = "nmap"
+    with patch.object(nmap_integration, "run", side_effect=fake_run) as mock_run:
+        result = nmap_integration.scan("10.0.0.0/30", output_xml=str(xml_file))
+
+    args, kwargs = mock_run.call_args
+    assert args[:2] == ("-oX", str(xml_file))
+    assert kwargs["output_file"] == str(xml_file)
+    assert [host["ip_address"] for host in result["hosts"]] == [
+        "10.0.0.1",
+        "10.0.0.2",
+    ]
+
+
+def test_scan_saves_output_xml_from_container(nmap_integration, tmp_path):
+    """Test that a container scan captures XML on stdout and saves it locally."""
+    xml_file = tmp_path / "scan.xml"
+    nmap_integration.binary_path = None
+    nmap_integration.use_container = True
+
+    def fake_run(*args, **kwargs):
+        return nmap_integration._build_result(
+            list(args), datetime.now(), 0, 0, SAMPLE_XML.encode(), ""
+        )
+
+    nmap_integration.name = "nmap"
+    with patch.object(nmap_integration, "run", side_effect=fake_run) as mock_run:
+        result = nmap_integration.scan("10.0.0.0/30", output_xml=str(xml_file))
+
+    args, kwargs = mock_run.call_args
+    assert args[:2] == ("-oX", "-")
+    assert kwargs["binary_stdout"] is True
+    assert xml_file.read_text() == SAMPLE_XML
+    assert len(result["hosts"]) == 2
+
+
+def test_parse_output_skips_malformed_port(nmap_integration, caplog, capsys):
+    """Test that a malformed port is logged at debug level and skipped."""
+    xml = SAMPLE_XML.replace('portid="443"', 'portid="https"')
+
+    with caplog.at_level("DEBUG", logger="penkit.integrations.nmap_integration"):
+        result = nmap_integration.parse_output(xml, "")
+
+    ports = result["hosts"][0]["open_ports"]
+    assert [port["port"] for port in ports] == [22, 80]
+    assert "Error parsing port" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def test_parsed_host_validates_as_model(nmap_integration):
+    """Test that parsed host fields are accepted by the Host model."""
+    host_elem = ET.fromstring(SAMPLE_XML.encode("utf-8")).find("host")
+
+    host = Host(**nmap_integration._parse_host_dict(host_elem))
+
+    assert host.status is HostStatus.UP
+    assert isinstance(host.open_ports[0], Port)
+
+
+def test_parse_port_version_without_product(nmap_integration):
+    """Test that a version with no product has no stray leading space."""
+    xml = SAMPLE_XML.replace('product="OpenSSH" ', "").replace(
+        'product="nginx" ', ""
+    )
+
+    ports = nmap_integration.parse_output(xml, "")["hosts"][0]["open_ports"]
+
+    assert ports[0]["version"] == "8.9p1"
+    assert ports[1]["version"] is None
+
+
+def test_scan_command_line(nmap_integration):
+    """Test that scan options are translated into nmap arguments."""
+    with patch.object(nmap_integration, "run") as mock_run:
+        mock_run.return_value.status = "success"
+        mock_run.return_value.parsed_result = {"hosts": []}
+        nmap_integration.scan(
+            "10.0.0.1",
+            "-Pn",
+            ports="22,80",
+            service_detection=True,
+            script_scan=True,
+            script="banner",
+            timing=4,
+        )
+
+    args, kwargs = mock_run.call_args
+    assert args == (
+        "-oX",
+        "-",
+        "-p",
+        "22,80",
+        "-sV",
+        "-sC",
+        "--script",
+        "banner",
+        "-T",
+        "4",
+        "-Pn",
+        "10.0.0.1",
+    )
+    assert kwargs == {"timeout": 600, "binary_stdout": True}
+
+
+@pytest.fixture
+def fake_nmap(tmp_path, nmap_integration):
+    """Point the integration at a script that prints SAMPLE_XML like nmap -oX -."""
+    xml_file = tmp_path / "scan.xml"
+    xml_file.write_text(SAMPLE_XML)
+    script = tmp_path / "nmap"
+    script.write_text(f'#!/bin/sh\nsleep "${{NMAP_DELAY:-0}}"\ncat "{xml_file}"\n')
+    script.chmod(0o755)
+    nmap_integration.binary_path = str(script)
+    return nmap_integration
+
+
+def test_scan_parses_tool_output(fake_nmap):
+    """Test that a scan runs the binary and parses the XML it prints."""
+    result = fake_nmap.scan("10.0.0.0/30", timeout=30)
+
+    assert result["scan_info"]["version"] == "7.94"
+    assert [host["ip_address"] for host in result["hosts"]] == [
+        "10.0.0.1",
+        "10.0.0.2",
+    ]
+
+
+def test_scan_timeout(fake_nmap, monkeypatch):
+    """Test that a scan running past its timeout raises an integration error."""
+    monkeypatch.setenv("NMAP_DELAY", "5")
+
+    with pytest.raises(IntegrationError, match="timed out after 0.5 seconds"):
+        fake_nmap.scan("10.0.0.1", timeout=0.5)
@@ -1,10 +1,13 @@
 """Test SQLmap integration functionality."""
 
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from penkit.core.exceptions import IntegrationError
+from penkit.integrations import base
+from penkit.integrations import sqlmap_integration as sqlmap_module
 from penkit.integrations.sqlmap_integration import SQLMapIntegration
 
 
@@ -56,6 +59,7 @@ def test_sqlmap_scan_command_building(sqlmap_integration):
             mock_result = MagicMock()
             mock_result.status = "success"
             mock_result.parsed_result = {"test": "data"}
+            mock_result.stdout_path = None
             mock_run.return_value = mock_result
 
             # Call the scan method
@@ -126,7 +130,7 @@ def test_parse_text_output(sqlmap_integration):
     [12:04:06] [INFO] the back-end DBMS is MySQL
     parameter 'id' is vulnerable to error-based injection
     SQLmap finished at 2023-01-01 12:05:00
-    scan completed
+    Scan Completed
     '''
     
     # Parse the output
@@ -157,4 +161,333 @@ def test_get_vulnerability_summary(sqlmap_integration):
     
     # Check the result
     assert summary["error-based"] == 2
-    assert summary["time-based"] == 1
\ No newline at end of file
+    assert summary["time-based"] == 1
+
+def test_parse_json_output_with_trailing_braces(sqlmap_integration):
+    """Test that text with braces after the JSON object does not break parsing."""
+    output = (
+        'log line\n{"data": {"vulnerable": {"http://example.com/?id=1": '
+        '{"boolean-based": {}}}, "stats": {}}}\n[INFO] done {retries: 0}\n'
+    )
+
+    result = sqlmap_integration.parse_output(output, "")
+
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == ["boolean-based"]
+
+
+def fake_sqlmap_run(json_by_url):
+    """Build a run() stand-in that writes JSON results like sqlmap does.
+
+    Args:
+        json_by_url: JSON document to write for each target URL
+
+    Returns:
+        Function to patch in for SQLMapIntegration.run
+    """
+
+    def run(*args, **kwargs):
+        options = dict(zip(args, args[1:]))
+        Path(options["--json-output"]).write_text(json_by_url[options["-u"]])
+        result = MagicMock()
+        result.status = "success"
+        result.stdout_path = None
+        return result
+
+    return run
+
+
+def test_scan_reads_json_results(sqlmap_integration, tmp_path):
+    """Test that scan results are read from the --json-output file."""
+    sqlmap_integration._supports_json_output = True
+    url = "http://example.com/?id=1"
+    run = fake_sqlmap_run(
+        {
+            url: '{"data": {"vulnerable": {"http://example.com/?id=1": '
+            '{"time-based": {"parameter": "id"}}}, "stats": {"queries": 3}}}'
+        }
+    )
+
+    with patch.object(sqlmap_integration, "run", side_effect=run):
+        result = sqlmap_integration.scan(url, output_dir=str(tmp_path))
+
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == ["time-based"]
+    assert result["summary"] == {"queries": 3}
+    # The per-scan results file is removed once read
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parse_text_output_fields(sqlmap_integration):
+    """Test the URL, parameters and scan time extracted from text output."""
+    text_output = (
+        "[12:04:05] [INFO] GET parameter 'id' is vulnerable to 'boolean-based blind'\n"
+        "URL: http://example.com/?id=1&name=a\n"
+        "POST parameter 'name' is vulnerable to 'time-based blind'\n"
+        "[*] scan spent 0:01:02\n"
+        "[*] scan spent 9:99:99\n"
+    )
+
+    result = sqlmap_integration._parse_text_output(text_output)
+
+    assert [
+        (vuln["parameter"], vuln["type"], vuln["url"])
+        for vuln in result["vulnerabilities"]
+    ] == [
+        ("id", "boolean-based blind", "http://example.com/?id=1&name=a"),
+        ("name", "time-based blind", "http://example.com/?id=1&name=a"),
+    ]
+    assert result["summary"]["scan_time"] == "0:01:02"
+    assert result["summary"]["vulnerabilities_found"] == 2
+    assert result["summary"]["scan_completed"] is False
+
+
+def test_capabilities_are_checked_once(tmp_path, monkeypatch):
+    """Test that --help is only run once for the same sqlmap binary."""
+    calls = tmp_path / "calls"
+    binary = tmp_path / "sqlmap"
+    binary.write_text(f"#!/bin/sh\necho \"$@\" >> {calls}\necho --json-output\n")
+    binary.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    monkeypatch.setattr(base, "_BINARY_CACHE", {})
+    monkeypatch.setattr(sqlmap_module, "_JSON_OUTPUT_SUPPORT", {})
+
+    integrations = [SQLMapIntegration(), SQLMapIntegration()]
+
+    assert all(integration._supports_json_output for integration in integrations)
+    assert calls.read_text().splitlines() == ["--batch --help"]
+
+
+def test_container_capabilities_are_checked_once(sqlmap_integration, monkeypatch):
+    """Test that --help is only run once for the same sqlmap container image."""
+    monkeypatch.setattr(sqlmap_module, "_JSON_OUTPUT_SUPPORT", {})
+    sqlmap_integration.binary_path = None
+    sqlmap_integration.use_container = True
+
+    with patch.object(sqlmap_integration, "run") as mock_run:
+        mock_run.return_value.stdout = "--json-output"
+        for _ in range(2):
+            sqlmap_integration._supports_json_output = False
+            sqlmap_integration._check_capabilities()
+
+    assert sqlmap_integration._supports_json_output is True
+    mock_run.assert_called_once_with("--help")
+    assert list(sqlmap_module._JSON_OUTPUT_SUPPORT) == [
+        ("container:" + SQLMapIntegration.container_image, 0)
+    ]
+
+
+def test_parse_output_from_file_matches_text(sqlmap_integration, tmp_path):
+    """Test that streamed output parses like in-memory text output."""
+    text_output = (
+        "URL: http://example.com/?id=1\n"
+        "[12:04:05] [CRITICAL] parameter 'id' is vulnerable to SQL injection\n"
+        "[12:04:06] [INFO] the back-end DBMS is MySQL\n"
+        "parameter 'id' is vulnerable to 'error-based'\n"
+        "[*] scan spent 0:00:42\n"
+        "scan completed\n"
+    )
+    output_file = tmp_path / "stdout.txt"
+    output_file.write_text(text_output)
+
+    result = sqlmap_integration.parse_output_from_file(str(output_file), "")
+
+    expected = sqlmap_integration._parse_text_output(text_output)
+    assert result["raw_output"] == text_output
+    assert result["vulnerabilities"] == expected["vulnerabilities"]
+    assert result["summary"] == expected["summary"]
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == [
+        "SQL injection",
+        "error-based",
+    ]
+
+
+def test_scan_removes_streamed_output(sqlmap_integration, tmp_path):
+    """Test that the streamed stdout file is parsed and then removed."""
+    sqlmap_integration._supports_json_output = False
+    stdout_file = tmp_path / "sqlmap.out"
+    stdout_file.write_text("parameter 'id' is vulnerable to 'UNION query'\n")
+
+    with patch.object(sqlmap_integration, "run") as mock_run:
+        mock_run.return_value.status = "success"
+        mock_run.return_value.parsed_result = None
+        mock_run.return_value.stdout_path = str(stdout_file)
+        mock_run.return_value.stderr = ""
+        result = sqlmap_integration.scan(
+            "http://example.com/?id=1", output_dir=str(tmp_path)
+        )
+
+    assert mock_run.call_args.kwargs["stream"] is True
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == ["UNION query"]
+    assert not stdout_file.exists()
+
+
+def test_scan_option_flags(sqlmap_integration, tmp_path):
+    """Test that scan options are translated into sqlmap flags."""
+    sqlmap_integration._supports_json_output = False
+
+    with patch.object(sqlmap_integration, "run") as mock_run:
+        mock_run.return_value.status = "success"
+        mock_run.return_value.parsed_result = {"test": "data"}
+        mock_run.return_value.stdout_path = None
+        sqlmap_integration.scan(
+            "http://example.com/?id=1",
+            "--flush-session",
+            output_dir=str(tmp_path),
+            data="id=1",
+            cookie="",
+            headers={"X-Test": "1"},
+            level=3,
+            forms=True,
+            threads=4,
+        )
+
+    args = mock_run.call_args.args
+    assert args == (
+        "-u",
+        "http://example.com/?id=1",
+        "--batch",
+        "--output-dir",
+        str(tmp_path),
+        "--data",
+        "id=1",
+        "--level",
+        "3",
+        "--threads",
+        "4",
+        "-H",
+        "X-Test: 1",
+        "--forms",
+        "--flush-session",
+    )
+
+
+def test_scan_without_json_results_file(sqlmap_integration, tmp_path):
+    """Test falling back to stdout results when no JSON file was written."""
+    sqlmap_integration._supports_json_output = True
+
+    with patch.object(sqlmap_integration, "run") as mock_run:
+        mock_run.return_value.status = "success"
+        mock_run.return_value.parsed_result = {"test": "data"}
+        mock_run.return_value.stdout_path = None
+        result = sqlmap_integration.scan(
+            "http://example.com/?id=1", output_dir=str(tmp_path)
+        )
+
+    assert result == {"test": "data"}
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ('{"data": {}}', {"data": {}}),
+        ('[INFO] {retries} {"data": {}}', {"data": {}}),
+        ('{"x": 1} {"data": {"a": "}{\\"}"}}', {"data": {"a": '}{"}'}}),
+        ('[INFO] payload AND {x\n{"data": {}}', {"data": {}}),
+        ("it's {'data'} done", None),
+        ('{"data": {', None),
+    ],
+)
+def test_locate_json(output, expected):
+    """Test locating the JSON object among log output."""
+    assert sqlmap_module._locate_json(output) == expected
+
+
+def test_default_output_dir_created_once(tmp_path, monkeypatch):
+    """Test that the default output directory is resolved and created once."""
+    monkeypatch.setattr(sqlmap_module, "_DEFAULT_OUTPUT_DIR", None)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    expected = str(tmp_path / ".penkit" / "sqlmap_output")
+
+    with patch.object(sqlmap_module.os, "makedirs") as mock_makedirs:
+        first = sqlmap_module._default_output_dir()
+        second = sqlmap_module._default_output_dir()
+
+    assert first == second == expected
+    mock_makedirs.assert_called_once_with(expected, exist_ok=True)
+
+
+def test_parse_json_output_after_json_like_log_text(sqlmap_integration):
+    """Test that a brace block that is not JSON does not hide the results."""
+    output = (
+        '[DEBUG] payload {"data": 1 AND 1=1}\n'
+        '{"data": {"vulnerable": {"http://example.com/?id=1": '
+        '{"boolean-based": {}}}}}\n'
+    )
+
+    result = sqlmap_integration.parse_output(output, "")
+
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == ["boolean-based"]
+
+
+def test_parse_json_output_after_unbalanced_brace(sqlmap_integration):
+    """Test that a stray opening brace in log text does not hide the results."""
+    output = (
+        "[INFO] payload AND {x\n"
+        '{"data": {"vulnerable": {"http://example.com/?id=1": '
+        '{"boolean-based": {}}}}}\n'
+    )
+
+    result = sqlmap_integration.parse_output(output, "")
+
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == ["boolean-based"]
+
+
+def test_parse_output_bytes(sqlmap_integration):
+    """Test that stdout captured as bytes is decoded before parsing."""
+    output = (
+        b"[INFO] Parameter 'id' is vulnerable to 'boolean-based blind'\n"
+        b"[INFO] scan completed\n"
+    )
+
+    result = sqlmap_integration.parse_output(output, "")
+
+    assert isinstance(result["raw_output"], str)
+    assert [vuln["parameter"] for vuln in result["vulnerabilities"]] == ["id"]
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        "[]",
+        '{"data": []}',
+        '{"data": {"vulnerable": ["http://example.com/?id=1"], "stats": 3}}',
+        '{"data": {"vulnerable": {"http://example.com/?id=1": ["UNION query"]}}}',
+    ],
+)
+def test_scan_with_malformed_json_results(sqlmap_integration, tmp_path, document):
+    """Test that JSON results of an unexpected shape do not break a scan."""
+    sqlmap_integration._supports_json_output = True
+    url = "http://example.com/?id=1"
+
+    def run(*args, **kwargs):
+        result = fake_sqlmap_run({url: document})(*args, **kwargs)
+        result.parsed_result = {"vulnerabilities": [], "summary": {"from": "stdout"}}
+        return result
+
+    with patch.object(sqlmap_integration, "run", side_effect=run):
+        result = sqlmap_integration.scan(url, output_dir=str(tmp_path))
+
+    assert result["vulnerabilities"] == []
+    assert isinstance(result["summary"], dict)
+
+
+def test_parse_output_skips_json_without_data_object(sqlmap_integration):
+    """Test that JSON whose data is not an object falls back to text parsing."""
+    output = '{"data": []}\nparameter \'id\' is vulnerable to \'UNION query\'\n'
+
+    result = sqlmap_integration.parse_output(output, "")
+
+    assert [vuln["type"] for vuln in result["vulnerabilities"]] == ["UNION query"]
+
+
+def test_parse_output_from_file_keeps_output_tail(
+    sqlmap_integration, tmp_path, monkeypatch
+):
+    """Test that only the last lines of long streamed output are kept."""
+    monkeypatch.setattr(sqlmap_module, "RAW_OUTPUT_TAIL_LINES", 2)
+    output_file = tmp_path / "stdout.txt"
+    output_file.write_text("one\ntwo\nthree\n")
+
+    result = sqlmap_integration.parse_output_from_file(str(output_file), "")
+
+    assert result["raw_output"] == "two\nthree\n"
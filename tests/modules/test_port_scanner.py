@@ -0,0 +1,97 @@
+"""Test port scanner module functionality."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from penkit.core.exceptions import ModuleError
+from penkit.modules.port_scanner import PortScannerPlugin
+
+
+@pytest.fixture
+def port_scanner():
+    """Create a port scanner plugin instance for testing."""
+    with patch("penkit.modules.port_scanner.NmapIntegration") as MockNmap:
+        MockNmap.return_value = MagicMock()
+        plugin = PortScannerPlugin()
+        plugin.options["target"] = "10.0.0.1"
+        return plugin
+
+
+def test_run_without_target(port_scanner):
+    """Test running without a target."""
+    port_scanner.options["target"] = ""
+
+    with pytest.raises(ModuleError) as exc_info:
+        port_scanner.run()
+
+    assert "Target must be specified" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "scan_type, expected_args",
+    [
+        ("tcp", ("-sT",)),
+        ("syn", ("-sS",)),
+        ("udp", ("-sU",)),
+        ("ping", ()),
+    ],
+)
+def test_scan_type_arguments(port_scanner, scan_type, expected_args):
+    """Test that each scan type is passed to nmap as the right flag."""
+    port_scanner.options["scan_type"] = scan_type
+    port_scanner.options["show_only_open"] = True
+    port_scanner.nmap.scan.return_value = {"hosts": []}
+
+    port_scanner.run()
+
+    args, kwargs = port_scanner.nmap.scan.call_args
+    assert args == ("10.0.0.1", *expected_args, "--open")
+    assert kwargs["ports"] == "1-1000"
+
+
+def test_run_wraps_scan_errors(port_scanner):
+    """Test that scan failures are reported as module errors."""
+    port_scanner.nmap.scan.side_effect = RuntimeError("boom")
+
+    with pytest.raises(ModuleError) as exc_info:
+        port_scanner.run()
+
+    assert "Port scan failed: boom" in str(exc_info.value)
+
+
+def test_minimal_output(port_scanner):
+    """Test that minimal output keeps only open ports and their key fields."""
+    port_scanner.options["output_format"] = "minimal"
+    port_scanner.nmap.scan.return_value = {
+        "hosts": [
+            {
+                "ip_address": "10.0.0.1",
+                "hostname": "gateway",
+                "status": "up",
+                "open_ports": [
+                    {"port": 22, "protocol": "tcp", "state": "open", "service": "ssh"},
+                    {"port": 443, "protocol": "tcp", "state": "filtered"},
+                ],
+            }
+        ]
+    }
+
+    assert port_scanner.run() == {
+        "target": "10.0.0.1",
+        "hosts": [
+            {
+                "ip": "10.0.0.1",
+                "hostname": "gateway",
+                "open_ports": [
+                    {
+                        "port": 22,
+                        "service": "ssh",
+                        "protocol": "tcp",
+                        "version": None,
+                        "banner": None,
+                    }
+                ],
+            }
+        ],
+    }
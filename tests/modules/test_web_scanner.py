@@ -1,16 +1,21 @@
 """Test web scanner module functionality."""
 
+import threading
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from penkit.core.exceptions import ModuleError
-from penkit.modules.web_scanner import WebScannerPlugin
+from penkit.integrations import sqlmap_integration as sqlmap_module
+from penkit.integrations.sqlmap_integration import SQLMapIntegration
+from penkit.modules.web_scanner import WebScannerPlugin, _get_sqlmap_integration
 
 
 @pytest.fixture
 def web_scanner():
     """Create a web scanner plugin instance for testing."""
+    _get_sqlmap_integration.cache_clear()
     with patch("penkit.integrations.sqlmap_integration.SQLMapIntegration") as MockSQLMap:
         # Configure the mock
         mock_sqlmap = MagicMock()
@@ -121,3 +126,163 @@ def test_scan_failure_handling(web_scanner):
     
     assert "Web vulnerability scan failed" in str(exc_info.value)
     assert "Connection error" in str(exc_info.value)
+
+
+def test_sqlmap_integration_is_shared():
+    """Test that plugin instances share one SQLmap integration."""
+    _get_sqlmap_integration.cache_clear()
+    with patch("penkit.integrations.sqlmap_integration.SQLMapIntegration") as MockSQLMap:
+        first = WebScannerPlugin()
+        second = WebScannerPlugin()
+    _get_sqlmap_integration.cache_clear()
+
+    assert first.sqlmap is second.sqlmap
+    MockSQLMap.assert_called_once_with()
+
+
+def test_run_multiple_urls(web_scanner):
+    """Test that a list of target URLs is scanned and returned in order."""
+    urls = ["http://a.example.com", "http://b.example.com"]
+    web_scanner.options["target_url"] = urls
+    web_scanner.sqlmap.quick_scan.side_effect = lambda url: {
+        "vulnerabilities": [{"type": "error-based", "url": url}],
+    }
+
+    results = web_scanner.run()
+
+    assert [result["target_url"] for result in results] == urls
+    assert [result["vulnerabilities"][0]["url"] for result in results] == urls
+    assert web_scanner.sqlmap.quick_scan.call_count == 2
+
+
+def test_run_multiple_urls_failure(web_scanner):
+    """Test that a failed scan among several URLs raises a module error."""
+    web_scanner.options["target_url"] = ["http://a.example.com"]
+    web_scanner.sqlmap.quick_scan.side_effect = Exception("Connection error")
+
+    with pytest.raises(ModuleError, match="Connection error"):
+        web_scanner.run()
+
+
+def test_scan_options_rebuilt_when_options_change(web_scanner):
+    """Test that cached scan options follow changes to the module options."""
+    first = web_scanner._build_scan_options()
+    assert web_scanner._build_scan_options() is first
+
+    web_scanner.options["scan_level"] = "3"
+    assert web_scanner._build_scan_options()["level"] == "3"
+
+    web_scanner.set_option("threads", "4")
+    assert web_scanner._build_scan_options()["threads"] == 4
+
+
+def test_build_scan_options_skips_empty(web_scanner):
+    """Test that unset options and disabled crawl/threads are left out."""
+    web_scanner.options.update({"data": "", "cookie": "sid=1", "threads": 1})
+
+    assert web_scanner._build_scan_options() == {
+        "cookie": "sid=1",
+        "user_agent": "PenKit Web Scanner",
+        "level": 1,
+        "risk": 1,
+        "forms": True,
+        "timeout": 1800,
+    }
+
+    web_scanner.options.update({"crawl_depth": 2, "threads": 4})
+    options = web_scanner._build_scan_options()
+    assert (options["crawl"], options["threads"]) == (2, 4)
+
+
+def test_web_scanner_has_no_instance_dict(web_scanner):
+    """Test that plugin state lives in slots rather than an instance dict."""
+    assert not hasattr(web_scanner, "__dict__")
+
+
+def test_set_option_parses_integers(web_scanner):
+    """Test that integer options are parsed when they are set."""
+    assert web_scanner.set_option("crawl_depth", "3") is True
+    assert web_scanner.options["crawl_depth"] == 3
+
+    assert web_scanner.set_option("threads", "many") is False
+    assert web_scanner.set_option("threads", "") is False
+    assert web_scanner.options["threads"] == 1
+
+
+@pytest.mark.parametrize("value", [None, "", "2", "many"])
+def test_build_scan_options_tolerates_raw_values(web_scanner, value):
+    """Test that integer options assigned directly do not break a scan."""
+    web_scanner.options["crawl_depth"] = value
+    web_scanner.options["threads"] = value
+
+    options = web_scanner._build_scan_options()
+
+    expected = 2 if value == "2" else None
+    assert (options.get("crawl"), options.get("threads")) == (expected, expected)
+
+
+def test_repeat_scan_uses_result_cache(web_scanner):
+    """Test that results are cached only on request and marked when reused."""
+    web_scanner.options["target_url"] = "http://example.com"
+    web_scanner.sqlmap.quick_scan.return_value = {
+        "vulnerabilities": [{"type": "error-based"}],
+    }
+
+    # Caching is off by default, so every run rescans
+    web_scanner.run()
+    web_scanner.run()
+    assert web_scanner.sqlmap.quick_scan.call_count == 2
+
+    web_scanner.set_option("cache_results", True)
+    first = web_scanner.run()
+    first["vulnerabilities"].clear()
+    second = web_scanner.run()
+
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert len(second["vulnerabilities"]) == 1
+    assert web_scanner.sqlmap.quick_scan.call_count == 3
+
+    # A different SQLmap setup is a different scan
+    web_scanner.sqlmap.binary_path = "/opt/sqlmap/sqlmap.py"
+    web_scanner.run()
+    assert web_scanner.sqlmap.quick_scan.call_count == 4
+
+    with patch("penkit.modules.web_scanner.time.monotonic", return_value=1e12):
+        web_scanner.run()
+    assert web_scanner.sqlmap.quick_scan.call_count == 5
+
+def test_concurrent_urls_keep_their_own_results(web_scanner, tmp_path, monkeypatch):
+    """Test that overlapping scans never read back another URL's findings."""
+    monkeypatch.setattr(sqlmap_module, "_DEFAULT_OUTPUT_DIR", str(tmp_path))
+    with patch.object(SQLMapIntegration, "__init__", return_value=None):
+        sqlmap = SQLMapIntegration()
+    sqlmap.binary_path = "/usr/bin/sqlmap"
+    sqlmap.use_container = False
+    sqlmap._supports_json_output = True
+    web_scanner.sqlmap = sqlmap
+
+    # Both scans write their results before either reads them back
+    both_written = threading.Barrier(2)
+
+    def run(*args, **kwargs):
+        options = dict(zip(args, args[1:]))
+        url = options["-u"]
+        Path(options["--json-output"]).write_text(
+            f'{{"data": {{"vulnerable": {{"{url}": {{"{url[7]}-based": {{}}}}}}}}}}'
+        )
+        both_written.wait(timeout=5)
+        result = MagicMock()
+        result.status = "success"
+        result.stdout_path = None
+        return result
+
+    urls = ["http://a.example.com", "http://b.example.com"]
+    web_scanner.options["target_url"] = urls
+    with patch.object(sqlmap, "run", side_effect=run):
+        results = web_scanner.run()
+
+    assert [
+        [(vuln["url"], vuln["type"]) for vuln in result["vulnerabilities"]]
+        for result in results
+    ] == [[(urls[0], "a-based")], [(urls[1], "b-based")]]
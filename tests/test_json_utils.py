@@ -0,0 +1,62 @@
+"""Test JSON utility functions."""
+
+import datetime
+import io
+import json
+
+import pytest
+
+from penkit.utils import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson, when installed, and with the stdlib encoder."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_dumps_datetimes(encoder) -> None:
+    """Test that datetimes and dates are encoded as ISO strings."""
+    obj = {
+        "at": datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+        "on": datetime.date(2024, 1, 2),
+    }
+
+    assert json.loads(json_utils.dumps(obj)) == {
+        "at": "2024-01-02T03:04:05.000006",
+        "on": "2024-01-02",
+    }
+
+
+def test_dumps_non_string_keys(encoder) -> None:
+    """Test that objects orjson rejects are still encoded."""
+    assert json.loads(json_utils.dumps({80: "http"}, indent=True)) == {"80": "http"}
+
+
+def test_dump_to_file(encoder) -> None:
+    """Test writing indented JSON to a binary file."""
+    buffer = io.BytesIO()
+
+    json_utils.dump({"ports": [22, 80]}, buffer, indent=True)
+
+    assert buffer.getvalue() == json.dumps({"ports": [22, 80]}, indent=2).encode()
+    assert not buffer.closed
+
+
+def test_dump_non_string_keys(encoder) -> None:
+    """Test that a file dump falls back for objects orjson cannot encode."""
+    buffer = io.BytesIO()
+
+    json_utils.dump({80: datetime.date(2024, 1, 2)}, buffer)
+
+    assert json.loads(buffer.getvalue()) == {"80": "2024-01-02"}
+
+
+def test_dumps_unserializable(encoder) -> None:
+    """Test that unserializable objects raise TypeError."""
+    with pytest.raises(TypeError):
+        json_utils.dumps({"obj": object()})
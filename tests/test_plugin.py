@@ -1,5 +1,6 @@
 """Test plugin manager functionality."""
 
+import os
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -125,7 +126,7 @@ def test_plugin_manager_unload_plugin() -> None:
 
 @patch("importlib.import_module")
 @patch("penkit.core.plugin.Path")
-def test_plugin_discovery(mock_path, mock_import_module) -> None:
+def test_plugin_discovery(mock_path, mock_import_module, tmp_path) -> None:
     """Test plugin discovery."""
     # Mock the module that would be discovered
     mock_module = type("MockModule", (), {})
@@ -136,25 +137,23 @@ def test_plugin_discovery(mock_path, mock_import_module) -> None:
     mock_modules_dir = MagicMock()
     mock_path.return_value.parent.parent.__truediv__.return_value = mock_modules_dir
     mock_modules_dir.exists.return_value = True
-    
-    # Create a mock item to simulate a module directory
-    mock_path_item = MagicMock()
-    mock_path_item.name = "test_module"
-    mock_path_item.is_dir.return_value = True
-    
-    # Setup the __truediv__ method to handle path / "__init__.py"
-    mock_init_py = MagicMock()
-    mock_init_py.exists.return_value = True
-    mock_path_item.__truediv__.return_value = mock_init_py
-    
-    # Set up the iterdir to return our mock path item
-    mock_modules_dir.iterdir.return_value = [mock_path_item]
+
+    # Lay out a module package, a directory without __init__.py and a file
+    (tmp_path / "test_module").mkdir()
+    (tmp_path / "test_module" / "__init__.py").touch()
+    (tmp_path / "not_a_package").mkdir()
+    (tmp_path / "README.md").touch()
 
     # Create a plugin manager
     manager = PluginManager()
-    
-    # Discover plugins
-    manager._discover_internal_plugins()
+
+    # Discover plugins from the laid out directory
+    real_scandir = os.scandir
+    with patch.object(os, "scandir") as mock_scandir:
+        mock_scandir.side_effect = lambda path: real_scandir(tmp_path)
+        manager._discover_internal_plugins()
 
     # Verify the plugin was discovered
-    assert "test_plugin" in manager.plugins
\ No newline at end of file
+    assert "test_plugin" in manager.plugins
+    mock_scandir.assert_called_once_with(mock_modules_dir)
+    mock_import_module.assert_called_once_with("penkit.modules.test_module")
@@ -0,0 +1,43 @@
+"""Test session management functionality."""
+
+from penkit.core.session import SessionManager
+
+
+def test_get_session_returns_cached_instance(tmp_path) -> None:
+    """Test that repeated lookups reuse the same session."""
+    manager = SessionManager(base_path=tmp_path)
+    created = manager.create_session("engagement")
+
+    assert manager.get_session("engagement") is created
+    assert manager.get_session("engagement") is manager.get_session("engagement")
+
+
+def test_get_session_missing(tmp_path) -> None:
+    """Test getting a session that does not exist."""
+    manager = SessionManager(base_path=tmp_path)
+
+    assert manager.get_session("missing") is None
+
+
+def test_delete_session_invalidates_cache(tmp_path) -> None:
+    """Test that deleting a session drops the cached instance."""
+    manager = SessionManager(base_path=tmp_path)
+    manager.create_session("engagement")
+
+    assert manager.delete_session("engagement") is True
+    assert manager.get_session("engagement") is None
+
+    recreated = manager.create_session("engagement")
+    assert manager.get_session("engagement") is recreated
+
+
+def test_recreated_session_can_save_results(tmp_path) -> None:
+    """Test that a session recreated after deletion can still write results."""
+    manager = SessionManager(base_path=tmp_path)
+    manager.create_session("engagement").save_scan_result("nmap", {"hosts": []})
+    manager.delete_session("engagement")
+
+    session = manager.create_session("engagement")
+    session.save_scan_result("nmap", {"hosts": []})
+
+    assert list((session.path / "results").iterdir())